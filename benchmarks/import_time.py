@@ -0,0 +1,79 @@
+"""
+Benchmark: cost of `import ps_helper` in a fresh interpreter.
+
+Each run starts a new Python process that imports ps_helper and reports its
+import time, peak RSS, thread count and which heavy PDF/OCR modules ended up
+loaded. "lazy" only imports the package (what a spider that uses URLBlocker
+or the metrics extension pays); "pdf" also touches ps_helper.pdf_analyzer,
+which is what every import used to cost.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("fitz", "PIL", "pytesseract", "requests")
+
+CHILD = """
+import json, resource, sys, threading, time
+start = time.perf_counter()
+import ps_helper
+if {touch_pdf}:
+    ps_helper.pdf_analyzer
+seconds = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": seconds,
+    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "threads": threading.active_count(),
+    "loaded": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure(touch_pdf, repeat):
+    code = CHILD.format(touch_pdf=touch_pdf, heavy=HEAVY_MODULES)
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        "median_ms": statistics.median(run["seconds"] for run in runs) * 1000,
+        "peak_rss_mb": statistics.median(run["peak_rss_kb"] for run in runs) / 1024,
+        "threads": runs[-1]["threads"],
+        "loaded": runs[-1]["loaded"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    lazy = measure(False, args.repeat)
+    pdf = measure(True, args.repeat)
+
+    for label, result in (("lazy", lazy), ("pdf", pdf)):
+        print(
+            f"{label:<5} import {result['median_ms']:8.1f} ms  "
+            f"peak RSS {result['peak_rss_mb']:6.1f} MB  "
+            f"threads {result['threads']}  "
+            f"loaded: {', '.join(result['loaded']) or '-'}"
+        )
+    print(
+        f"Saved: {pdf['median_ms'] - lazy['median_ms']:8.1f} ms and "
+        f"{pdf['peak_rss_mb'] - lazy['peak_rss_mb']:.1f} MB per process"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark: memoized `_normalize_key` on a taxonomy normalization workload.
+
+Builds a product-category taxonomy and a stream of items whose category
+signals (LLM output, breadcrumb, title) are drawn from it with case, symbol
+and spacing noise, like a spider would see. Reports the per-call cost of
+`_normalize_key` (regex version it replaced, precompiled without cache,
+memoized) and the end-to-end cost of `normalize_with_confidence` with and
+without the cache, plus the cache hit rate.
+
+Usage:
+    python benchmarks/normalize_key_cache.py [--categories 400] [--items 300]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from ps_helper.confidence import normalized_value
+from ps_helper.confidence.normalized_value import normalize_with_confidence
+
+DEPARTMENTS = [
+    "Home", "Kitchen", "Outdoor", "Kids", "Pets", "Office", "Garden", "Bath",
+    "Sports", "Beauty", "Tools", "Electronics",
+]
+NOUNS = [
+    "Trays", "Bowls", "Lamps", "Chairs", "Rugs", "Towels", "Mugs", "Planters",
+    "Shelves", "Bags", "Cables", "Brushes", "Bottles", "Pillows", "Baskets",
+]
+ADJECTIVES = ["Serving", "Storage", "Decorative", "Travel", "Smart", "Kids'", "Outdoor", "Mini"]
+
+
+def legacy_normalize_key(value):
+    """The regex-per-call version `_normalize_key` replaced."""
+    if value is None:
+        return ""
+    text = str(value)
+    text = text.replace("\u200b", "").replace("\ufeff", "")
+    text = re.sub(r"[®™©]", "", text)
+    text = re.sub(r"[^a-zA-Z0-9\+\&\-\s]", " ", text)
+    text = re.sub(r"\s+", " ", text).strip().lower()
+    return text
+
+
+def make_taxonomy(size, rng):
+    taxonomy = set()
+    while len(taxonomy) < size:
+        taxonomy.add(f"{rng.choice(DEPARTMENTS)} & {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}")
+    return sorted(taxonomy)
+
+
+def noisy(value, rng):
+    change = rng.choice(("upper", "lower", "symbols", "spaces", "same"))
+    if change == "upper":
+        return value.upper()
+    if change == "lower":
+        return value.lower()
+    if change == "symbols":
+        return f"{value}™ /"
+    if change == "spaces":
+        return f"  {value.replace(' ', '  ')}\u200b"
+    return value
+
+
+def make_items(taxonomy, count, rng):
+    items = []
+    for _ in range(count):
+        category = rng.choice(taxonomy)
+        items.append(
+            [
+                {"value": noisy(category, rng), "weight": 0.7, "source": "llm"},
+                {"value": noisy(category.split(" & ")[0], rng), "weight": 0.2, "source": "breadcrumb"},
+                {"value": f"Acme {noisy(category, rng)} set of 4", "weight": 0.1, "source": "title"},
+            ]
+        )
+    return items
+
+
+def per_call(function, values, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for value in values:
+            function(value)
+    return (time.perf_counter() - start) / (repeat * len(values))
+
+
+def end_to_end(items, taxonomy):
+    start = time.perf_counter()
+    for signals in items:
+        normalize_with_confidence(extracted_values=signals, allowed_values=taxonomy, field_name="category")
+    return (time.perf_counter() - start) / len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--categories", type=int, default=400)
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    taxonomy = make_taxonomy(args.categories, rng)
+    items = make_items(taxonomy, args.items, rng)
+    strings = taxonomy + [signal["value"] for signals in items for signal in signals]
+    print(f"taxonomy: {len(taxonomy)} categories  items: {len(items)}  strings: {len(strings)}")
+
+    cached = normalized_value._normalize_text
+    uncached = cached.__wrapped__
+
+    legacy = per_call(legacy_normalize_key, strings, args.repeat)
+    normalized_value._normalize_text = uncached
+    try:
+        compiled = per_call(normalized_value._normalize_key, strings, args.repeat)
+        no_cache = end_to_end(items, taxonomy)
+    finally:
+        normalized_value._normalize_text = cached
+
+    normalized_value.clear_normalize_key_cache()
+    memoized = per_call(normalized_value._normalize_key, strings, args.repeat)
+    normalized_value.clear_normalize_key_cache()
+    with_cache = end_to_end(items, taxonomy)
+    info = normalized_value.normalize_key_cache_info()
+
+    print("_normalize_key per call:")
+    for label, seconds in (("regex per call", legacy), ("precompiled", compiled), ("memoized", memoized)):
+        print(f"  {label:<15} {seconds * 1e6:8.2f} us  ({legacy / seconds:5.1f}x)")
+    print("normalize_with_confidence per item:")
+    print(f"  {'no cache':<15} {no_cache * 1000:8.2f} ms")
+    print(f"  {'memoized':<15} {with_cache * 1000:8.2f} ms  ({no_cache / with_cache:5.2f}x)")
+    lookups = info["hits"] + info["misses"]
+    print(
+        f"cache: {info['currsize']}/{info['maxsize']} keys  "
+        f"hit rate {info['hits'] / max(1, lookups):.3f} over {lookups} lookups"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: trigram candidate shortlist vs brute-force ranking in NormalizerIndex.
+
+Builds a synthetic brand/product catalog and queries made from catalog
+entries with typos, dropped words and extra tokens. For each
+`candidate_limit`, reports time per `normalize` call and recall against the
+brute-force ranking: how often the top-1 suggestion matches, and how much of
+the top-k candidate list is the same.
+
+Usage:
+    python benchmarks/normalizer_candidates.py [--size 20000] [--queries 200]
+        [--limits 50 200 1000] [--top-k 3]
+"""
+
+import argparse
+import random
+import string
+import time
+
+from ps_helper.confidence import NormalizerIndex
+
+SYLLABLES = [
+    "ka", "lo", "ri", "ta", "mon", "ver", "sol", "tex", "pro", "lux", "ar",
+    "bel", "co", "dia", "el", "fi", "gra", "hal", "in", "jo", "ne", "ox",
+]
+SUFFIXES = ["", " Inc", " Co", " Labs", " Home", " Outdoor", " Kids", " Pro"]
+
+
+def make_catalog(size, rng):
+    catalog = set()
+    while len(catalog) < size:
+        words = [
+            "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).title()
+            for _ in range(rng.randint(1, 3))
+        ]
+        catalog.add(" ".join(words) + rng.choice(SUFFIXES))
+    return sorted(catalog)
+
+
+def perturb(value, rng):
+    chars = list(value)
+    change = rng.choice(("typo", "drop", "extra", "case", "swap"))
+    if change == "typo" and len(chars) > 3:
+        chars[rng.randrange(len(chars))] = rng.choice(string.ascii_lowercase)
+    elif change == "swap" and len(chars) > 3:
+        index = rng.randrange(len(chars) - 1)
+        chars[index], chars[index + 1] = chars[index + 1], chars[index]
+    elif change == "drop" and " " in value:
+        words = value.split()
+        words.pop(rng.randrange(len(words)))
+        return " ".join(words)
+    elif change == "extra":
+        return f"{value} {rng.choice(['official', 'store', 'brand', 'usa'])}"
+    else:
+        return value.upper()
+    return "".join(chars)
+
+
+def run(index, queries, top_k):
+    start = time.perf_counter()
+    results = [index.normalize(query, top_k=top_k) for query in queries]
+    seconds = (time.perf_counter() - start) / len(queries)
+    return seconds, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limits", nargs="+", type=int, default=[50, 200, 1000])
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    catalog = make_catalog(args.size, rng)
+    queries = [perturb(rng.choice(catalog), rng) for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    brute_index = NormalizerIndex(catalog)
+    print(f"catalog: {len(brute_index)} values  queries: {len(queries)}  top_k: {args.top_k}")
+    print(f"brute force   build {time.perf_counter() - start:6.2f} s", end="  ")
+    brute_seconds, expected = run(brute_index, queries, args.top_k)
+    print(f"{brute_seconds * 1000:9.2f} ms/query")
+
+    for limit in args.limits:
+        start = time.perf_counter()
+        index = NormalizerIndex(catalog, candidate_limit=limit)
+        build_seconds = time.perf_counter() - start
+        seconds, results = run(index, queries, args.top_k)
+
+        top1_hits = 0
+        overlap = 0
+        for want, got in zip(expected, results):
+            top1_hits += want["suggested_value"] == got["suggested_value"]
+            want_values = {c["value"] for c in want["audit"]["top_candidates"]}
+            got_values = {c["value"] for c in got["audit"]["top_candidates"]}
+            overlap += len(want_values & got_values) / max(1, len(want_values))
+        print(
+            f"limit {limit:<7} build {build_seconds:6.2f} s  "
+            f"{seconds * 1000:9.2f} ms/query  "
+            f"({brute_seconds / seconds:6.1f}x)  "
+            f"recall@1 {top1_hits / len(queries):.3f}  "
+            f"top-{args.top_k} overlap {overlap / len(queries):.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Micro-benchmark: pixmap -> PIL image conversion in the OCR path.
+
+Compares the old PNG encode/decode round trip with the direct sample buffer
+wrap used by PDFAnalyzer, on every page of the PDFs under
+tests/PS-TEST-PDF-ANALYZER. Tesseract is not involved.
+
+Usage:
+    python benchmarks/ocr_image_conversion.py [--repeat 20] [--grayscale] [pdf_dir]
+"""
+
+import argparse
+import glob
+import io
+import os
+import time
+
+import fitz
+from PIL import Image
+
+from ps_helper.pdf.pdf_analyzer import PDFAnalyzer, _pixmap_to_image, _render_page
+
+DEFAULT_PDF_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests",
+    "PS-TEST-PDF-ANALYZER",
+)
+
+
+def png_round_trip(pix):
+    image = Image.open(io.BytesIO(pix.tobytes("png")))
+    image.load()
+    return image
+
+
+def direct_buffer(pix):
+    return _pixmap_to_image(pix)
+
+
+def time_conversion(pixmaps, convert, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for pix in pixmaps:
+            image = convert(pix)
+            # Tesseract reads every pixel, so force the decode here as well
+            image.getbbox()
+            image.close()
+    return (time.perf_counter() - start) / (repeat * len(pixmaps))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pdf_dir", nargs="?", default=DEFAULT_PDF_DIR)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--grayscale",
+        action="store_true",
+        help="render in grayscale instead of the default RGB",
+    )
+    args = parser.parse_args()
+    ocr_options = PDFAnalyzer(ocr_grayscale=args.grayscale)._ocr_options()
+
+    pdf_paths = sorted(
+        glob.glob(os.path.join(args.pdf_dir, "**", "*.pdf"), recursive=True)
+    )
+    if not pdf_paths:
+        print(f"No PDFs found under {args.pdf_dir}")
+        return
+
+    pixmaps = []
+    for path in pdf_paths:
+        with fitz.open(path) as doc:
+            for page in doc:
+                pixmaps.append(_render_page(page, ocr_options))
+
+    png_seconds = time_conversion(pixmaps, png_round_trip, args.repeat)
+    direct_seconds = time_conversion(pixmaps, direct_buffer, args.repeat)
+
+    print(f"PDFs: {len(pdf_paths)}  pages: {len(pixmaps)}  repeat: {args.repeat}")
+    print(f"PNG round trip: {png_seconds * 1000:8.2f} ms/page")
+    print(f"Direct buffer:  {direct_seconds * 1000:8.2f} ms/page")
+    print(
+        f"Saved:          {(png_seconds - direct_seconds) * 1000:8.2f} ms/page "
+        f"({png_seconds / direct_seconds:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
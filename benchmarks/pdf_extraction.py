@@ -0,0 +1,240 @@
+"""
+Benchmark: PDFAnalyzer throughput on synthetic corpora.
+
+Generates born-digital, scanned, mixed and large-page PDFs in memory and runs
+extract_text_from_pdf (one document at a time) and extract_text_batch across
+worker counts. Each scenario runs in a fresh process so peak RSS is its own.
+Reports pages/sec, peak RSS and OCR calls, and saves everything as JSON.
+
+Tesseract is used when installed; `--ocr simulated` replaces it with a fixed
+delay per page so the rest of the pipeline can be measured anywhere.
+
+Usage:
+    python benchmarks/pdf_extraction.py [--corpus mixed] [--workers 1 2 4]
+        [--documents 8] [--pages 10] [--ocr simulated] [--output run.json]
+        [--compare previous.json]
+"""
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz
+
+from ps_helper.pdf.instrumentation import PDFTimingStats
+from ps_helper.pdf.pdf_analyzer import PDFAnalyzer
+
+CORPORA = ("born-digital", "scanned", "mixed", "large-page")
+MODES = ("single", "batch")
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+PARAGRAPH = (
+    "Invoice {doc}-{page}. The supplier agrees to deliver the goods listed "
+    "below within thirty days of the order date. Payment is due on receipt. "
+    "Questions about this document can be sent to the accounts department."
+)
+A0_SIZE = (2384, 3370)
+
+
+class SimulatedOCRBackend:
+    """Stands in for Tesseract: returns fixed text after `delay` seconds."""
+
+    name = "simulated"
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def image_to_string(self, image, lang, config):
+        time.sleep(self.delay)
+        return "simulated ocr text"
+
+    def close(self):
+        pass
+
+
+def _text_page(doc, text, size=None):
+    width, height = size or fitz.paper_size("a4")
+    page = doc.new_page(width=width, height=height)
+    page.insert_textbox(fitz.Rect(72, 72, width - 72, height - 72), text, fontsize=11)
+    return page
+
+
+def _scanned_page(doc, text, size=None):
+    """Page holding only an image of text, like a scanner would produce."""
+    with fitz.open() as source:
+        pix = _text_page(source, text, size).get_pixmap(dpi=150, colorspace=fitz.csGRAY)
+    width, height = size or fitz.paper_size("a4")
+    page = doc.new_page(width=width, height=height)
+    page.insert_image(page.rect, pixmap=pix)
+    return page
+
+
+def build_document(corpus, doc_index, page_count):
+    doc = fitz.open()
+    for page_index in range(page_count):
+        text = PARAGRAPH.format(doc=doc_index, page=page_index + 1)
+        if corpus == "born-digital":
+            _text_page(doc, text)
+        elif corpus == "scanned":
+            _scanned_page(doc, text)
+        elif corpus == "mixed":
+            (_scanned_page if page_index % 2 else _text_page)(doc, text)
+        else:
+            # Large-format plans: text layer on even pages, scans on odd ones
+            (_scanned_page if page_index % 2 else _text_page)(doc, text, A0_SIZE)
+    data = doc.tobytes(garbage=3, deflate=True)
+    doc.close()
+    return data
+
+
+def build_corpus(corpus, documents, pages):
+    return [build_document(corpus, index, pages) for index in range(documents)]
+
+
+def run_scenario(corpus, mode, workers, documents, pages, ocr, ocr_delay):
+    """Run one scenario in the current (fresh) process and return its metrics."""
+    pdfs = build_corpus(corpus, documents, pages)
+    timings = PDFTimingStats()
+    analyzer = PDFAnalyzer(
+        max_workers=workers,
+        ocr_backend=SimulatedOCRBackend(ocr_delay) if ocr == "simulated" else "auto",
+        instrumentation=timings,
+    )
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    if mode == "single":
+        results = [analyzer.extract_text_from_pdf(pdf) for pdf in pdfs]
+    else:
+        results = analyzer.extract_text_batch(pdfs)
+    seconds = time.perf_counter() - start
+    analyzer.close()
+
+    histograms = timings.snapshot()
+    page_count = sum(result.get("total_pages", 0) for result in results)
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        "corpus": corpus,
+        "mode": mode,
+        "workers": workers,
+        "documents": len(pdfs),
+        "pages": page_count,
+        "seconds": round(seconds, 4),
+        "pages_per_sec": round(page_count / seconds, 2) if seconds else None,
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * rss_unit / 2**20, 1
+        ),
+        "baseline_rss_mb": round(rss_before * rss_unit / 2**20, 1),
+        "ocr_calls": histograms.get("page/ocr", {}).get("count", 0),
+        "errors": sum(1 for result in results if not result.get("success")),
+        "phase_seconds": {
+            name.split("/", 1)[1]: histogram["total_seconds"]
+            for name, histogram in histograms.items()
+            if name.startswith("document/")
+        },
+    }
+
+
+def compare(previous_path, results):
+    with open(previous_path, encoding="utf-8") as f:
+        previous = {
+            (r["corpus"], r["mode"], r["workers"]): r for r in json.load(f)["results"]
+        }
+    print(f"\nCompared with {previous_path}:")
+    for result in results:
+        old = previous.get((result["corpus"], result["mode"], result["workers"]))
+        if not old or not old["pages_per_sec"] or not result["pages_per_sec"]:
+            continue
+        ratio = result["pages_per_sec"] / old["pages_per_sec"]
+        print(
+            f"  {result['corpus']:<13} {result['mode']:<6} w={result['workers']:<2} "
+            f"{old['pages_per_sec']:>8.1f} -> {result['pages_per_sec']:>8.1f} pages/s "
+            f"({ratio:.2f}x)  rss {old['peak_rss_mb']} -> {result['peak_rss_mb']} MB"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", nargs="+", choices=CORPORA, default=list(CORPORA))
+    parser.add_argument("--mode", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument("--documents", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--ocr", choices=("tesseract", "simulated"), default="tesseract")
+    parser.add_argument(
+        "--ocr-delay", type=float, default=0.05, help="seconds per simulated OCR page"
+    )
+    parser.add_argument("--output", help="JSON file to write (default: benchmarks/results/)")
+    parser.add_argument("--compare", help="previous JSON output to compare against")
+    args = parser.parse_args()
+
+    scenarios = [
+        (corpus, mode, workers)
+        for corpus in args.corpus
+        for mode in args.mode
+        # One-at-a-time extraction does not use the batch pool
+        for workers in (args.workers if mode == "batch" else [1])
+    ]
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for corpus, mode, workers in scenarios:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            result = pool.submit(
+                run_scenario,
+                corpus,
+                mode,
+                workers,
+                args.documents,
+                args.pages,
+                args.ocr,
+                args.ocr_delay,
+            ).result()
+        results.append(result)
+        print(
+            f"{corpus:<13} {mode:<6} workers={workers:<2} "
+            f"{result['pages_per_sec'] or 0:>8.1f} pages/s  "
+            f"peak RSS {result['peak_rss_mb']:>7.1f} MB  "
+            f"OCR calls {result['ocr_calls']:>4}  errors {result['errors']}"
+        )
+
+    output = args.output or os.path.join(
+        DEFAULT_OUTPUT_DIR,
+        datetime.datetime.now().strftime("pdf_extraction-%Y-%m-%d_%H-%M-%S.json"),
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "meta": {
+                    "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "pymupdf": fitz.VersionBind,
+                    "platform": platform.platform(),
+                    "cpu_count": os.cpu_count(),
+                    "ocr": args.ocr,
+                    "ocr_delay": args.ocr_delay if args.ocr == "simulated" else None,
+                    "documents": args.documents,
+                    "pages": args.pages,
+                },
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"Saved: {output}")
+
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
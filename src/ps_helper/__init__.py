@@ -1,24 +1,62 @@
+import threading
+
 from .hello import hello
 from .blockers.url_blocker import URLBlocker
 
 # PDF ANALYZER
-from .pdf.pdf_analyzer import PDFAnalyzer
+# fitz, PIL, pytesseract and requests are only imported, and the default
+# analyzer (with its thread pool) only built, when PDF support is first used.
+_pdf_analyzer_lock = threading.Lock()
+
+
+def _default_analyzer():
+    analyzer = globals().get("pdf_analyzer")
+    if analyzer is None:
+        with _pdf_analyzer_lock:
+            analyzer = globals().get("pdf_analyzer")
+            if analyzer is None:
+                from .pdf.pdf_analyzer import PDFAnalyzer
+
+                analyzer = globals()["pdf_analyzer"] = PDFAnalyzer()
+    return analyzer
+
+
+def __getattr__(name):
+    if name == "PDFAnalyzer":
+        from .pdf.pdf_analyzer import PDFAnalyzer
 
-pdf_analyzer = PDFAnalyzer()
+        return PDFAnalyzer
+    if name == "pdf_analyzer":
+        return _default_analyzer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {"PDFAnalyzer", "pdf_analyzer"})
 
 
 def extract_text_from_pdf(pdf_source, **kwargs):
-    return pdf_analyzer.extract_text_from_pdf(pdf_source, **kwargs)
+    return _default_analyzer().extract_text_from_pdf(pdf_source, **kwargs)
+
+
+async def aextract_text_from_pdf(pdf_source, **kwargs):
+    return await _default_analyzer().aextract_text_from_pdf(pdf_source, **kwargs)
 
 
 def extract_text_batch(pdf_sources, **kwargs):
-    return pdf_analyzer.extract_text_batch(pdf_sources, **kwargs)
+    return _default_analyzer().extract_text_batch(pdf_sources, **kwargs)
+
+
+def iter_text_batch(pdf_sources, **kwargs):
+    return _default_analyzer().iter_text_batch(pdf_sources, **kwargs)
 
 
 __all__ = [
     "PDFAnalyzer",
     "pdf_analyzer",
     "extract_text_from_pdf",
+    "aextract_text_from_pdf",
     "extract_text_batch",
+    "iter_text_batch",
     "URLBlocker",
 ]
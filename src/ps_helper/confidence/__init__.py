@@ -1,3 +1,15 @@
-from .normalized_value import normalize_with_confidence, score_normalized_value
+from .normalized_value import (
+    NormalizerIndex,
+    clear_normalize_key_cache,
+    normalize_key_cache_info,
+    normalize_with_confidence,
+    score_normalized_value,
+)
 
-__all__ = ["score_normalized_value", "normalize_with_confidence"]
+__all__ = [
+    "score_normalized_value",
+    "normalize_with_confidence",
+    "NormalizerIndex",
+    "normalize_key_cache_info",
+    "clear_normalize_key_cache",
+]
@@ -1,6 +1,9 @@
+import heapq
 import re
+from collections import Counter, defaultdict
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 
 DEFAULT_THRESHOLDS = {
@@ -14,15 +17,40 @@ DEFAULT_THRESHOLDS = {
 }
 
 
+# Keys are recomputed for the same strings on every call (allowed values,
+# each signal against each candidate), so the string -> key step is memoized.
+NORMALIZE_KEY_CACHE_SIZE = 16384
+
+_DROPPED_CHARS = re.compile("[\u200b\ufeff®™©]")
+_NON_KEY_CHARS = re.compile(r"[^a-zA-Z0-9\+\&\-\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=NORMALIZE_KEY_CACHE_SIZE)
+def _normalize_text(text: str) -> str:
+    text = _DROPPED_CHARS.sub("", text)
+    text = _NON_KEY_CHARS.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
 def _normalize_key(value: Any) -> str:
     if value is None:
         return ""
-    text = str(value)
-    text = text.replace("\u200b", "").replace("\ufeff", "")
-    text = re.sub(r"[®™©]", "", text)
-    text = re.sub(r"[^a-zA-Z0-9\+\&\-\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip().lower()
-    return text
+    return _normalize_text(str(value))
+
+
+def normalize_key_cache_info() -> Dict[str, int]:
+    """Hit/miss counters and size of the normalized-key cache."""
+    return _normalize_text.cache_info()._asdict()
+
+
+def clear_normalize_key_cache() -> None:
+    _normalize_text.cache_clear()
+
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
 
 
 def _dedupe_values(values: List[Any]) -> List[str]:
@@ -38,9 +66,7 @@ def _dedupe_values(values: List[Any]) -> List[str]:
     return output
 
 
-def _similarity(left: Any, right: Any) -> float:
-    left_key = _normalize_key(left)
-    right_key = _normalize_key(right)
+def _key_similarity(left_key: str, right_key: str) -> float:
     if not left_key or not right_key:
         return 0.0
     if left_key == right_key:
@@ -58,13 +84,80 @@ def _confidence_label(score: float, thresholds: Dict[str, float]) -> str:
     return "LOW"
 
 
-def _rank_candidates(extracted_value: Any, allowed_values: List[str], top_k: int) -> List[Dict[str, Any]]:
-    ranked = [
-        {"value": value, "score": round(_similarity(extracted_value, value), 4)}
-        for value in allowed_values
-    ]
-    ranked.sort(key=lambda item: item["score"], reverse=True)
-    return ranked[:max(0, top_k)]
+def _rank_candidates(
+    extracted_value: Any,
+    allowed_values: List[str],
+    top_k: int,
+    allowed_keys: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    if allowed_keys is None:
+        allowed_keys = [_normalize_key(value) for value in allowed_values]
+    return _top_k_candidates([(_normalize_key(extracted_value), 1.0)], allowed_values, allowed_keys, top_k)
+
+
+def _bounded_similarity(matchers: List[Tuple[SequenceMatcher, str, float]], key: str, floor: Optional[float]) -> Optional[float]:
+    """Weighted similarity of `key`, or None when it cannot round above `floor`.
+
+    `real_quick_ratio` and `quick_ratio` are upper bounds of `ratio`, so a
+    candidate whose bound already rounds to `floor` or less is dropped before
+    the expensive `ratio()` call.
+    """
+    if floor is not None:
+        bound = sum(
+            (1.0 if input_key == key else 2.0 * min(len(input_key), len(key)) / (len(input_key) + len(key)))
+            * weight
+            if input_key and key
+            else 0.0
+            for _, input_key, weight in matchers
+        )
+        if round(bound, 4) <= floor:
+            return None
+
+    for matcher, input_key, _ in matchers:
+        if input_key and key and input_key != key:
+            matcher.set_seq2(key)
+
+    if floor is not None:
+        bound = sum(
+            (1.0 if input_key == key else matcher.quick_ratio()) * weight if input_key and key else 0.0
+            for matcher, input_key, weight in matchers
+        )
+        if round(bound, 4) <= floor:
+            return None
+
+    return sum(
+        (1.0 if input_key == key else matcher.ratio()) * weight if input_key and key else 0.0
+        for matcher, input_key, weight in matchers
+    )
+
+
+def _top_k_candidates(
+    weighted_keys: List[Tuple[str, float]],
+    allowed_values: List[str],
+    allowed_keys: List[str],
+    top_k: int,
+) -> List[Dict[str, Any]]:
+    """Best `top_k` allowed values by rounded weighted similarity.
+
+    Same result as scoring every value and stable-sorting by score: ties keep
+    list order. A min-heap holds the current best; once it is full, a value
+    only enters by scoring strictly above the k-th best.
+    """
+    if top_k <= 0:
+        return []
+    matchers = [(SequenceMatcher(None, input_key, ""), input_key, weight) for input_key, weight in weighted_keys]
+    heap = []
+    for position, (value, key) in enumerate(zip(allowed_values, allowed_keys)):
+        floor = heap[0][0] if len(heap) >= top_k else None
+        similarity = _bounded_similarity(matchers, key, floor)
+        if similarity is None:
+            continue
+        item = (round(similarity, 4), -position, value)
+        if len(heap) < top_k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+    return [{"value": value, "score": score} for score, _, value in sorted(heap, reverse=True)]
 
 
 def _label_rank(label: str) -> int:
@@ -132,24 +225,356 @@ def _normalize_extracted_values(
     ]
 
 
-def _weighted_similarity(input_signals: List[Dict[str, Any]], candidate: Any) -> float:
-    return sum(
-        _similarity(signal["value"], candidate) * float(signal["weight"])
-        for signal in input_signals
-    )
-
-
 def _rank_weighted_candidates(
     input_signals: List[Dict[str, Any]],
     allowed_values: List[str],
     top_k: int,
+    allowed_keys: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
-    ranked = [
-        {"value": value, "score": round(_weighted_similarity(input_signals, value), 4)}
-        for value in allowed_values
+    if allowed_keys is None:
+        allowed_keys = [_normalize_key(value) for value in allowed_values]
+    weighted_keys = [
+        (_normalize_key(signal["value"]), float(signal["weight"]))
+        for signal in input_signals
     ]
-    ranked.sort(key=lambda item: item["score"], reverse=True)
-    return ranked[:max(0, top_k)]
+    return _top_k_candidates(weighted_keys, allowed_values, allowed_keys, top_k)
+
+
+class NormalizerIndex:
+    """Allowed values normalized and deduped once, for repeated scoring.
+
+    Build it once per taxonomy and call `normalize` / `score` per item; the
+    result dicts are the same as `normalize_with_confidence` and
+    `score_normalized_value` with the same allowed values.
+
+    For very large lists set `candidate_limit`: a character-trigram inverted
+    index then picks that many allowed values per input (by trigram overlap)
+    and only those are scored with the usual similarity. Scores are
+    unchanged; a true best match with little trigram overlap can be missed.
+    """
+
+    def __init__(self, allowed_values: Optional[List[Any]] = None, candidate_limit: Optional[int] = None):
+        if candidate_limit is not None and candidate_limit <= 0:
+            raise ValueError("candidate_limit must be greater than 0")
+        self.values = _dedupe_values(allowed_values or [])
+        self.keys = [_normalize_key(value) for value in self.values]
+        self._values_by_key = dict(zip(self.keys, self.values))
+        self.candidate_limit = candidate_limit
+        self._exact_rankings = {}
+        self._postings = None
+        self._trigram_counts = None
+        if candidate_limit is not None and len(self.values) > candidate_limit:
+            self._build_trigram_index()
+
+    def _build_trigram_index(self) -> None:
+        postings = defaultdict(list)
+        trigram_counts = []
+        for position, key in enumerate(self.keys):
+            grams = _trigrams(key)
+            trigram_counts.append(len(grams))
+            for gram in grams:
+                postings[gram].append(position)
+        self._postings = dict(postings)
+        self._trigram_counts = trigram_counts
+
+    def _shortlist(self, input_keys: List[str]) -> Tuple[List[str], List[str]]:
+        """Allowed values (and keys) worth scoring for these inputs, in list order."""
+        if self._postings is None:
+            return self.values, self.keys
+
+        positions = set()
+        for input_key in input_keys:
+            grams = _trigrams(input_key)
+            shared = Counter()
+            for gram in grams:
+                shared.update(self._postings.get(gram, ()))
+            # Dice coefficient on trigram sets, like SequenceMatcher's 2*M/T
+            best = heapq.nlargest(
+                self.candidate_limit,
+                shared.items(),
+                key=lambda item: (2 * item[1] / (len(grams) + self._trigram_counts[item[0]]), -item[0]),
+            )
+            positions.update(position for position, _ in best)
+
+        ordered = sorted(positions)
+        return [self.values[i] for i in ordered], [self.keys[i] for i in ordered]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: Any) -> bool:
+        return _normalize_key(value) in self._values_by_key
+
+    def exact_match(self, value: Any) -> Optional[str]:
+        """Allowed value whose normalized key equals `value`'s, if any."""
+        return self._values_by_key.get(_normalize_key(value))
+
+    def top_candidates(self, extracted_value: Any, top_k: int = 3) -> List[Dict[str, Any]]:
+        """Best fuzzy candidates for one value, as in the audit block."""
+        values, keys = self._shortlist([_normalize_key(extracted_value)])
+        return _rank_candidates(extracted_value, values, top_k, keys)
+
+    def _allowed_ranking(self, key: str, top_k: int) -> List[Dict[str, Any]]:
+        """Candidate ranking for an allowed value's key, scored once per index.
+
+        A single input with the same key gets exactly this ranking from the
+        full scan, near duplicates (and the ambiguity check) included.
+        """
+        ranking = self._exact_rankings.get((key, top_k))
+        if ranking is None:
+            ranking = self.top_candidates(self._values_by_key[key], top_k)
+            self._exact_rankings[(key, top_k)] = ranking
+        return [dict(candidate) for candidate in ranking]
+
+    def _exact_ranking(self, input_signals: List[Dict[str, Any]], top_k: int) -> Optional[List[Dict[str, Any]]]:
+        if len(input_signals) != 1:
+            return None
+        key = _normalize_key(input_signals[0]["value"])
+        if key not in self._values_by_key:
+            return None
+        return self._allowed_ranking(key, top_k)
+
+    def normalize(
+        self,
+        extracted_value: Any = None,
+        *,
+        extracted_values: Optional[List[Any]] = None,
+        field_name: Optional[str] = None,
+        llm_confidence: Optional[float] = None,
+        minimum_label: str = "GOOD",
+        thresholds: Optional[Dict[str, float]] = None,
+        top_k: int = 3,
+        full_audit: bool = True,
+    ) -> Dict[str, Any]:
+        """Pick the best normalized value from the index and gate it.
+
+        Same arguments and result as `normalize_with_confidence`, minus
+        `allowed_values`.
+        """
+        active_thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        allowed = self.values
+        input_signals = _normalize_extracted_values(extracted_value, extracted_values)
+        llm_score = _coerce_score(llm_confidence)
+        flags = []
+
+        if not input_signals:
+            flags.append("missing_extracted_value")
+        if not allowed:
+            flags.append("empty_allowed_values")
+
+        candidate_ranking = None
+        if not full_audit:
+            candidate_ranking = self._exact_ranking(input_signals, top_k)
+        if candidate_ranking is None and input_signals and allowed:
+            values, keys = self._shortlist([_normalize_key(signal["value"]) for signal in input_signals])
+            candidate_ranking = _rank_weighted_candidates(input_signals, values, top_k, keys)
+        if candidate_ranking is None:
+            candidate_ranking = []
+        best_candidate = candidate_ranking[0] if candidate_ranking else None
+        match_score = float(best_candidate.get("score") or 0.0) if best_candidate else 0.0
+
+        if llm_score is not None and best_candidate:
+            confidence_score = (match_score * 0.85) + (llm_score * 0.15)
+        else:
+            confidence_score = match_score
+
+        confidence_score = round(max(0.0, min(1.0, confidence_score)), 4)
+        confidence_label = _confidence_label(confidence_score, active_thresholds)
+        minimum_label = str(minimum_label or "GOOD").upper()
+        accepted = bool(best_candidate) and _label_rank(confidence_label) >= _label_rank(minimum_label)
+
+        if best_candidate and confidence_score < active_thresholds["low_similarity_below"]:
+            flags.append("low_similarity_match")
+        if best_candidate and not accepted:
+            flags.append("below_minimum_threshold")
+        if len(candidate_ranking) >= 2:
+            top_score = float(candidate_ranking[0].get("score") or 0.0)
+            second_score = float(candidate_ranking[1].get("score") or 0.0)
+            if top_score - second_score <= active_thresholds["ambiguity_margin"]:
+                flags.append("ambiguous_classification")
+
+        suggested_value = best_candidate.get("value") if best_candidate else None
+        normalized_value = suggested_value if accepted else None
+        if not best_candidate:
+            status = "NO_MATCH"
+        elif accepted:
+            status = "NORMALIZED"
+        else:
+            status = "SUGGESTED"
+
+        requires_review = not accepted or confidence_score < active_thresholds["review_below"]
+        method = "weighted_fuzzy_match" if len(input_signals) > 1 else "fuzzy_match"
+        if best_candidate and len(input_signals) == 1 and _normalize_key(input_signals[0]["value"]) == _normalize_key(suggested_value):
+            method = "exact_match"
+
+        return {
+            "field_name": field_name,
+            "extracted_values": input_signals,
+            "normalized_value": normalized_value,
+            "suggested_value": suggested_value,
+            "accepted": accepted,
+            "confidence_score": confidence_score,
+            "confidence_label": confidence_label,
+            "normalization": {
+                "status": status,
+                "method": method if best_candidate else "no_match",
+                "match_score": round(match_score, 4),
+                "minimum_label": minimum_label,
+            },
+            "validation": {
+                "is_valid": accepted,
+                "flags": sorted(set(flags)),
+                "requires_review": requires_review,
+            },
+            "audit": {
+                "allowed_values_count": len(allowed),
+                "top_candidates": candidate_ranking,
+                "input_signals": input_signals,
+                "signals": {
+                    "match_score": round(match_score, 4),
+                    "llm_confidence_score": round(llm_score, 4) if llm_score is not None else None,
+                },
+                "thresholds": active_thresholds,
+            },
+        }
+
+    def score(
+        self,
+        extracted_value: Any,
+        normalized_value: Any,
+        *,
+        field_name: Optional[str] = None,
+        llm_confidence: Optional[float] = None,
+        top_candidates: Optional[List[Dict[str, Any]]] = None,
+        thresholds: Optional[Dict[str, float]] = None,
+        top_k: int = 3,
+        full_audit: bool = True,
+    ) -> Dict[str, Any]:
+        """Score confidence for an extracted value mapped to a normalized value.
+
+        Same arguments and result as `score_normalized_value`, minus
+        `allowed_values`.
+        """
+        active_thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        allowed = self.values
+        normalized_key = _normalize_key(normalized_value)
+        extracted_key = _normalize_key(extracted_value)
+        llm_score = _coerce_score(llm_confidence)
+
+        flags = []
+        if not extracted_key:
+            flags.append("missing_extracted_value")
+        if not normalized_key:
+            flags.append("missing_normalized_value")
+
+        normalized_in_allowed = bool(normalized_key and normalized_key in self._values_by_key)
+        if normalized_key and not normalized_in_allowed:
+            flags.append("taxonomy_missing_candidate")
+
+        exact_hit = normalized_in_allowed and extracted_key == normalized_key
+        if top_candidates is None and exact_hit and not full_audit:
+            candidate_ranking = self._allowed_ranking(normalized_key, top_k)
+        elif top_candidates is None:
+            candidate_ranking = self.top_candidates(extracted_value, top_k)
+        else:
+            candidate_ranking = [
+                {
+                    "value": candidate.get("value"),
+                    "score": round(_coerce_score(candidate.get("score")) or 0.0, 4),
+                }
+                for candidate in top_candidates[:max(0, top_k)]
+                if isinstance(candidate, dict)
+            ]
+
+        text_similarity = _key_similarity(extracted_key, normalized_key)
+        allowed_value_score = 1.0 if normalized_in_allowed else 0.0
+
+        method = "no_match"
+        if normalized_in_allowed:
+            if extracted_key and extracted_key == normalized_key:
+                method = "exact_match"
+            elif text_similarity > 0:
+                method = "fuzzy_match"
+            else:
+                method = "catalog_match"
+
+        candidate_rank_score = 0.0
+        normalized_candidate_score = None
+        for index, candidate in enumerate(candidate_ranking):
+            if _normalize_key(candidate.get("value")) == normalized_key:
+                normalized_candidate_score = float(candidate.get("score") or 0.0)
+                candidate_rank_score = max(0.0, 1.0 - (index * 0.2))
+                break
+
+        if normalized_candidate_score is None:
+            normalized_candidate_score = text_similarity if normalized_in_allowed else 0.0
+
+        if len(candidate_ranking) >= 2 and normalized_in_allowed:
+            top_score = float(candidate_ranking[0].get("score") or 0.0)
+            second_score = float(candidate_ranking[1].get("score") or 0.0)
+            if top_score - second_score <= active_thresholds["ambiguity_margin"]:
+                flags.append("ambiguous_classification")
+
+        if text_similarity < active_thresholds["low_similarity_below"] and normalized_in_allowed:
+            flags.append("low_similarity_match")
+
+        signals = {
+            "allowed_value_score": allowed_value_score,
+            "text_similarity_score": round(text_similarity, 4),
+            "candidate_rank_score": round(candidate_rank_score, 4),
+            "llm_confidence_score": round(llm_score, 4) if llm_score is not None else None,
+        }
+
+        weighted_signals = [
+            (allowed_value_score, 0.30),
+            (text_similarity, 0.35),
+            (candidate_rank_score, 0.20),
+        ]
+        if llm_score is not None:
+            weighted_signals.append((llm_score, 0.15))
+
+        total_weight = sum(weight for _, weight in weighted_signals)
+        confidence_score = (
+            sum(score * weight for score, weight in weighted_signals) / total_weight
+            if total_weight
+            else 0.0
+        )
+
+        if not normalized_in_allowed or not normalized_key or not extracted_key:
+            confidence_score = min(confidence_score, 0.59)
+
+        confidence_score = round(max(0.0, min(1.0, confidence_score)), 4)
+        confidence_label = _confidence_label(confidence_score, active_thresholds)
+        requires_review = confidence_score < active_thresholds["review_below"] or bool(
+            {"taxonomy_missing_candidate", "missing_normalized_value", "missing_extracted_value"} & set(flags)
+        )
+
+        status = "NORMALIZED" if normalized_in_allowed else "NO_MATCH"
+        is_valid = normalized_in_allowed and bool(extracted_key)
+
+        return {
+            "field_name": field_name,
+            "extracted_value": extracted_value,
+            "normalized_value": normalized_value,
+            "confidence_score": confidence_score,
+            "confidence_label": confidence_label,
+            "normalization": {
+                "status": status,
+                "method": method,
+                "match_score": round(normalized_candidate_score, 4),
+            },
+            "validation": {
+                "is_valid": is_valid,
+                "flags": sorted(set(flags)),
+                "requires_review": requires_review,
+            },
+            "audit": {
+                "allowed_values_count": len(allowed),
+                "top_candidates": candidate_ranking,
+                "signals": signals,
+                "thresholds": active_thresholds,
+            },
+        }
 
 
 def normalize_with_confidence(
@@ -162,91 +587,29 @@ def normalize_with_confidence(
     minimum_label: str = "GOOD",
     thresholds: Optional[Dict[str, float]] = None,
     top_k: int = 3,
+    full_audit: bool = True,
 ) -> Dict[str, Any]:
     """Pick the best normalized value from a controlled list and gate it.
 
     Pass `extracted_value` for the common case, or `extracted_values` with
     weights/sources when multiple signals should contribute to normalization.
+    Use `NormalizerIndex` instead when the same list is reused across calls.
+
+    With `full_audit=False`, a single input that normalizes to an allowed value
+    reuses that value's candidate ranking, scored once per `NormalizerIndex`,
+    instead of scanning the list again. The result is the same; only a reused
+    index saves work.
     """
-    active_thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
-    allowed = _dedupe_values(allowed_values or [])
-    input_signals = _normalize_extracted_values(extracted_value, extracted_values)
-    llm_score = _coerce_score(llm_confidence)
-    flags = []
-
-    if not input_signals:
-        flags.append("missing_extracted_value")
-    if not allowed:
-        flags.append("empty_allowed_values")
-
-    candidate_ranking = _rank_weighted_candidates(input_signals, allowed, top_k) if input_signals and allowed else []
-    best_candidate = candidate_ranking[0] if candidate_ranking else None
-    match_score = float(best_candidate.get("score") or 0.0) if best_candidate else 0.0
-
-    if llm_score is not None and best_candidate:
-        confidence_score = (match_score * 0.85) + (llm_score * 0.15)
-    else:
-        confidence_score = match_score
-
-    confidence_score = round(max(0.0, min(1.0, confidence_score)), 4)
-    confidence_label = _confidence_label(confidence_score, active_thresholds)
-    minimum_label = str(minimum_label or "GOOD").upper()
-    accepted = bool(best_candidate) and _label_rank(confidence_label) >= _label_rank(minimum_label)
-
-    if best_candidate and confidence_score < active_thresholds["low_similarity_below"]:
-        flags.append("low_similarity_match")
-    if best_candidate and not accepted:
-        flags.append("below_minimum_threshold")
-    if len(candidate_ranking) >= 2:
-        top_score = float(candidate_ranking[0].get("score") or 0.0)
-        second_score = float(candidate_ranking[1].get("score") or 0.0)
-        if top_score - second_score <= active_thresholds["ambiguity_margin"]:
-            flags.append("ambiguous_classification")
-
-    suggested_value = best_candidate.get("value") if best_candidate else None
-    normalized_value = suggested_value if accepted else None
-    if not best_candidate:
-        status = "NO_MATCH"
-    elif accepted:
-        status = "NORMALIZED"
-    else:
-        status = "SUGGESTED"
-
-    requires_review = not accepted or confidence_score < active_thresholds["review_below"]
-    method = "weighted_fuzzy_match" if len(input_signals) > 1 else "fuzzy_match"
-    if best_candidate and len(input_signals) == 1 and _normalize_key(input_signals[0]["value"]) == _normalize_key(suggested_value):
-        method = "exact_match"
-
-    return {
-        "field_name": field_name,
-        "extracted_values": input_signals,
-        "normalized_value": normalized_value,
-        "suggested_value": suggested_value,
-        "accepted": accepted,
-        "confidence_score": confidence_score,
-        "confidence_label": confidence_label,
-        "normalization": {
-            "status": status,
-            "method": method if best_candidate else "no_match",
-            "match_score": round(match_score, 4),
-            "minimum_label": minimum_label,
-        },
-        "validation": {
-            "is_valid": accepted,
-            "flags": sorted(set(flags)),
-            "requires_review": requires_review,
-        },
-        "audit": {
-            "allowed_values_count": len(allowed),
-            "top_candidates": candidate_ranking,
-            "input_signals": input_signals,
-            "signals": {
-                "match_score": round(match_score, 4),
-                "llm_confidence_score": round(llm_score, 4) if llm_score is not None else None,
-            },
-            "thresholds": active_thresholds,
-        },
-    }
+    return NormalizerIndex(allowed_values).normalize(
+        extracted_value,
+        extracted_values=extracted_values,
+        field_name=field_name,
+        llm_confidence=llm_confidence,
+        minimum_label=minimum_label,
+        thresholds=thresholds,
+        top_k=top_k,
+        full_audit=full_audit,
+    )
 
 
 def score_normalized_value(
@@ -259,127 +622,23 @@ def score_normalized_value(
     top_candidates: Optional[List[Dict[str, Any]]] = None,
     thresholds: Optional[Dict[str, float]] = None,
     top_k: int = 3,
+    full_audit: bool = True,
 ) -> Dict[str, Any]:
     """Score confidence for an extracted value mapped to a normalized value.
 
     This measures the observable quality of `extracted_value -> normalized_value`
     against a controlled list. It does not claim ground-truth accuracy.
+    Use `NormalizerIndex` instead when the same list is reused across calls.
+    `full_audit=False` reuses the candidate ranking of exact matches, as in
+    `normalize_with_confidence`.
     """
-    active_thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
-    allowed = _dedupe_values(allowed_values)
-    allowed_keys = {_normalize_key(value): value for value in allowed}
-    normalized_key = _normalize_key(normalized_value)
-    extracted_key = _normalize_key(extracted_value)
-    llm_score = _coerce_score(llm_confidence)
-
-    flags = []
-    if not extracted_key:
-        flags.append("missing_extracted_value")
-    if not normalized_key:
-        flags.append("missing_normalized_value")
-
-    normalized_in_allowed = bool(normalized_key and normalized_key in allowed_keys)
-    if normalized_key and not normalized_in_allowed:
-        flags.append("taxonomy_missing_candidate")
-
-    if top_candidates is None:
-        candidate_ranking = _rank_candidates(extracted_value, allowed, top_k)
-    else:
-        candidate_ranking = [
-            {
-                "value": candidate.get("value"),
-                "score": round(_coerce_score(candidate.get("score")) or 0.0, 4),
-            }
-            for candidate in top_candidates[:max(0, top_k)]
-            if isinstance(candidate, dict)
-        ]
-
-    text_similarity = _similarity(extracted_value, normalized_value)
-    allowed_value_score = 1.0 if normalized_in_allowed else 0.0
-
-    method = "no_match"
-    if normalized_in_allowed:
-        if extracted_key and extracted_key == normalized_key:
-            method = "exact_match"
-        elif text_similarity > 0:
-            method = "fuzzy_match"
-        else:
-            method = "catalog_match"
-
-    candidate_rank_score = 0.0
-    normalized_candidate_score = None
-    for index, candidate in enumerate(candidate_ranking):
-        if _normalize_key(candidate.get("value")) == normalized_key:
-            normalized_candidate_score = float(candidate.get("score") or 0.0)
-            candidate_rank_score = max(0.0, 1.0 - (index * 0.2))
-            break
-
-    if normalized_candidate_score is None:
-        normalized_candidate_score = text_similarity if normalized_in_allowed else 0.0
-
-    if len(candidate_ranking) >= 2 and normalized_in_allowed:
-        top_score = float(candidate_ranking[0].get("score") or 0.0)
-        second_score = float(candidate_ranking[1].get("score") or 0.0)
-        if top_score - second_score <= active_thresholds["ambiguity_margin"]:
-            flags.append("ambiguous_classification")
-
-    if text_similarity < active_thresholds["low_similarity_below"] and normalized_in_allowed:
-        flags.append("low_similarity_match")
-
-    signals = {
-        "allowed_value_score": allowed_value_score,
-        "text_similarity_score": round(text_similarity, 4),
-        "candidate_rank_score": round(candidate_rank_score, 4),
-        "llm_confidence_score": round(llm_score, 4) if llm_score is not None else None,
-    }
-
-    weighted_signals = [
-        (allowed_value_score, 0.30),
-        (text_similarity, 0.35),
-        (candidate_rank_score, 0.20),
-    ]
-    if llm_score is not None:
-        weighted_signals.append((llm_score, 0.15))
-
-    total_weight = sum(weight for _, weight in weighted_signals)
-    confidence_score = (
-        sum(score * weight for score, weight in weighted_signals) / total_weight
-        if total_weight
-        else 0.0
+    return NormalizerIndex(allowed_values).score(
+        extracted_value,
+        normalized_value,
+        field_name=field_name,
+        llm_confidence=llm_confidence,
+        top_candidates=top_candidates,
+        thresholds=thresholds,
+        top_k=top_k,
+        full_audit=full_audit,
     )
-
-    if not normalized_in_allowed or not normalized_key or not extracted_key:
-        confidence_score = min(confidence_score, 0.59)
-
-    confidence_score = round(max(0.0, min(1.0, confidence_score)), 4)
-    confidence_label = _confidence_label(confidence_score, active_thresholds)
-    requires_review = confidence_score < active_thresholds["review_below"] or bool(
-        {"taxonomy_missing_candidate", "missing_normalized_value", "missing_extracted_value"} & set(flags)
-    )
-
-    status = "NORMALIZED" if normalized_in_allowed else "NO_MATCH"
-    is_valid = normalized_in_allowed and bool(extracted_key)
-
-    return {
-        "field_name": field_name,
-        "extracted_value": extracted_value,
-        "normalized_value": normalized_value,
-        "confidence_score": confidence_score,
-        "confidence_label": confidence_label,
-        "normalization": {
-            "status": status,
-            "method": method,
-            "match_score": round(normalized_candidate_score, 4),
-        },
-        "validation": {
-            "is_valid": is_valid,
-            "flags": sorted(set(flags)),
-            "requires_review": requires_review,
-        },
-        "audit": {
-            "allowed_values_count": len(allowed),
-            "top_candidates": candidate_ranking,
-            "signals": signals,
-            "thresholds": active_thresholds,
-        },
-    }
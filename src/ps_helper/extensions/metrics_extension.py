@@ -8,6 +8,7 @@ from collections import defaultdict
 from pydantic import ValidationError
 from scrapy import signals
 
+from ..pdf.instrumentation import timing_summary
 from ..scripts.generate_report import generate_html_report
 from ..scripts.utils import upload_html_to_s3
 from .curl_metrics import record_curl_transfer_bytes
@@ -259,6 +260,7 @@ class MetricsExtension:
             },
             "timeline": timeline_sorted,
             "timeline_interval_minutes": interval_size,
+            "pdf_timings": timing_summary(self.stats.get_stats()),
         }
 
         # Save metrics in folder by date
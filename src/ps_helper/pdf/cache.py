@@ -0,0 +1,297 @@
+"""Content-addressed caches for PDFAnalyzer extraction results and page OCR."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of cached results changes so old entries stop matching
+CACHE_FORMAT_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def extraction_cache_key(pdf_content, settings: Dict[str, Any]) -> str:
+    """
+    Build a cache key from the PDF content and the settings that shape its text.
+
+    Args:
+        pdf_content: Raw PDF bytes (any bytes-like object) or a file path,
+            which is hashed in chunks without loading it whole
+        settings: JSON-serializable extraction settings (OCR language, DPI, ...)
+
+    Returns:
+        Hex digest identifying the extraction result
+    """
+    if isinstance(pdf_content, str):
+        digest = hashlib.sha256()
+        with open(pdf_content, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    else:
+        digest = hashlib.sha256(pdf_content)
+    digest.update(
+        json.dumps(
+            {"version": CACHE_FORMAT_VERSION, **settings}, sort_keys=True
+        ).encode("utf-8")
+    )
+    return digest.hexdigest()
+
+
+class _CacheStatsMixin:
+    """Hit/miss counters shared by every cache tier."""
+
+    def _init_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def _count(self, hit: bool):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def push_stats(self, stats, prefix: str = "pdf_analyzer/cache") -> None:
+        """Write the counters into a Scrapy stats collector."""
+        for name, value in self.stats.items():
+            stats.set_value(f"{prefix}/{name}", value)
+
+
+class MemoryLRUCache(_CacheStatsMixin):
+    """Thread-safe in-memory LRU cache holding up to `max_entries` results."""
+
+    def __init__(self, max_entries: int = 256):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._init_stats()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            self._count(value is not None)
+        return dict(value) if value is not None else None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = dict(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCache(_CacheStatsMixin):
+    """
+    JSON-file cache stored in `directory`, evicting least recently used
+    entries once the total size exceeds `max_bytes`.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes = OrderedDict()
+        self._total_bytes = 0
+        self._init_stats()
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """Index existing entries from oldest to newest access time."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name[: -len(".json")], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+            self._total_bytes += size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            # Refresh the access time used for LRU ordering
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self._count(False)
+            return None
+
+        with self._lock:
+            if key in self._sizes:
+                self._sizes.move_to_end(key)
+            self._count(True)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        data = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Could not write PDF cache entry {key}: {str(e)}")
+            return
+
+        with self._lock:
+            self._total_bytes += len(data) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(data)
+            self._evict()
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    @property
+    def size_bytes(self) -> int:
+        return self._total_bytes
+
+
+class TieredCache(_CacheStatsMixin):
+    """
+    Memory tier in front of a disk tier. Disk hits are promoted to memory.
+
+    Either tier may be omitted.
+    """
+
+    def __init__(
+        self,
+        memory: Optional[MemoryLRUCache] = None,
+        disk: Optional[DiskCache] = None,
+    ):
+        self.memory = memory
+        self.disk = disk
+        self._lock = threading.Lock()
+        self._init_stats()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = self.memory.get(key) if self.memory is not None else None
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None and self.memory is not None:
+                self.memory.set(key, value)
+
+        with self._lock:
+            self._count(value is not None)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        if self.memory is not None:
+            self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        stats = {"hits": self.hits, "misses": self.misses}
+        if self.memory is not None:
+            stats["memory_hits"] = self.memory.hits
+        if self.disk is not None:
+            stats["disk_hits"] = self.disk.hits
+        return stats
+
+
+def pixmap_digest(pixmap, ocr_settings: Dict[str, Any]) -> str:
+    """
+    Digest of a rendered page image plus the OCR settings applied to it.
+
+    Identical pages (cover sheets, boilerplate, blank signature pages) render
+    to identical samples, so they share the same digest across documents.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(
+        f"{pixmap.width}x{pixmap.height}x{pixmap.n}:{pixmap.stride}".encode("ascii")
+    )
+    digest.update(json.dumps(ocr_settings, sort_keys=True).encode("utf-8"))
+    digest.update(pixmap.samples_mv)
+    return digest.hexdigest()
+
+
+class PageOCRCache(_CacheStatsMixin):
+    """
+    Bounded LRU of OCR text keyed by pixmap digest.
+
+    Every hit is a Tesseract call that did not happen; `ocr_calls_avoided`
+    also includes hits reported by OCR worker processes.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._init_stats()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+            self._count(text is not None)
+        return text
+
+    def set(self, key: str, text: str) -> None:
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_hits(self, hits: int, misses: int = 0) -> None:
+        """Add hits/misses counted by a cache living in another process."""
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    @property
+    def ocr_calls_avoided(self) -> int:
+        return self.hits
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "ocr_calls_avoided": self.hits,
+        }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,136 @@
+"""Phase timing histograms for PDFAnalyzer, reported through Scrapy stats."""
+
+import threading
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+PHASES = ("download", "open", "native_text", "render", "ocr")
+# Upper bounds in seconds; observations above the last one land in "le_inf"
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+DEFAULT_PREFIX = "pdf_analyzer/timing"
+
+
+def add_timing(timings: Dict[str, float], phase: str, seconds: float) -> None:
+    """Accumulate `seconds` for `phase`; phases that never ran stay absent."""
+    timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+class TimingHistogram:
+    """Bucketed counts plus count, sum and max of observed durations."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        for index, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                break
+        else:
+            index = len(self.buckets)
+        self.counts[index] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{bound:g}" for bound in self.buckets] + ["le_inf"]
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 4),
+            "max_seconds": round(self.max_seconds, 4),
+            **dict(zip(labels, self.counts)),
+        }
+
+
+class PDFTimingStats:
+    """
+    Instrumentation hook for PDFAnalyzer(instrumentation=...).
+
+    Keeps one histogram per phase for whole documents ("document/<phase>",
+    plus "document/total") and for single pages ("page/<phase>"). When a
+    Scrapy stats collector is given, every recorded document is mirrored into
+    it under `prefix`, e.g. "pdf_analyzer/timing/page/ocr/le_2.5".
+
+    Safe to share between the threads of an analyzer pool.
+    """
+
+    def __init__(
+        self,
+        stats=None,
+        prefix: str = DEFAULT_PREFIX,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.stats = stats
+        self.prefix = prefix
+        self.buckets = buckets
+        self.histograms: Dict[str, TimingHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        timings: Dict[str, float],
+        page_timings: Iterable[Dict[str, float]] = (),
+    ) -> None:
+        """
+        Observe the phase timings of one extracted document.
+
+        Args:
+            timings: Seconds per phase for the whole document
+            page_timings: Seconds per phase for each processed page
+        """
+        with self._lock:
+            changed = set()
+            for phase, seconds in timings.items():
+                changed.add(self._observe(f"document/{phase}", seconds))
+            changed.add(self._observe("document/total", sum(timings.values())))
+            for page in page_timings:
+                for phase, seconds in page.items():
+                    changed.add(self._observe(f"page/{phase}", seconds))
+
+            if self.stats is not None:
+                self._push(self.stats, changed)
+
+    def _observe(self, name: str, seconds: float) -> str:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = TimingHistogram(self.buckets)
+        histogram.observe(seconds)
+        return name
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                name: histogram.snapshot()
+                for name, histogram in sorted(self.histograms.items())
+            }
+
+    def push_stats(self, stats) -> None:
+        """Write every histogram into a Scrapy stats collector."""
+        with self._lock:
+            self._push(stats, self.histograms)
+
+    def _push(self, stats, names: Iterable[str]) -> None:
+        for name in names:
+            for key, value in self.histograms[name].snapshot().items():
+                stats.set_value(f"{self.prefix}/{name}/{key}", value)
+
+
+def timing_summary(
+    stats_values: Dict[str, Any], prefix: str = DEFAULT_PREFIX
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Rebuild the histograms written by PDFTimingStats from a stats dict.
+
+    Returns {"document/ocr": {"count": ..., "le_1": ...}, ...}, or None when
+    no PDF timings were recorded.
+    """
+    summary: Dict[str, Dict[str, Any]] = {}
+    for key, value in stats_values.items():
+        if not key.startswith(f"{prefix}/"):
+            continue
+        name, _, field = key[len(prefix) + 1:].rpartition("/")
+        summary.setdefault(name, {})[field] = value
+    return dict(sorted(summary.items())) or None
@@ -0,0 +1,157 @@
+"""OCR engines used by PDFAnalyzer to turn rendered pages into text."""
+
+import logging
+import pickle
+import queue
+import re
+import threading
+from typing import Dict, Optional, Union
+
+import pytesseract
+
+try:
+    import tesserocr
+except ImportError:  # optional dependency: pip install ps-helper[tesserocr]
+    tesserocr = None
+
+logger = logging.getLogger(__name__)
+
+OCR_BACKENDS = ("auto", "tesserocr", "pytesseract")
+
+
+class PytesseractBackend:
+    """Runs the `tesseract` CLI through pytesseract, one process per page."""
+
+    name = "pytesseract"
+
+    def image_to_string(self, image, lang: str, config: str) -> str:
+        return pytesseract.image_to_string(image, lang=lang, config=config)
+
+    def close(self) -> None:
+        pass
+
+
+class TesserocrBackend:
+    """
+    Keeps long-lived Tesseract API handles so language models load only once.
+
+    Up to `pool_size` handles are created per language and shared between
+    threads; a caller waits when all of them are busy.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, pool_size: int = 1):
+        if tesserocr is None:
+            raise ImportError(
+                "tesserocr is not installed. Install it with "
+                "'pip install ps-helper[tesserocr]' or use the pytesseract backend."
+            )
+        self.pool_size = max(1, pool_size)
+        self._pools: Dict[tuple, queue.LifoQueue] = {}
+        self._created: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def image_to_string(self, image, lang: str, config: str) -> str:
+        key = (lang, *_parse_tesseract_config(config))
+        api = self._acquire(key)
+        try:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+        finally:
+            self._pools[key].put(api)
+
+    def _acquire(self, key: tuple):
+        with self._lock:
+            pool = self._pools.setdefault(key, queue.LifoQueue())
+            try:
+                return pool.get_nowait()
+            except queue.Empty:
+                pass
+            if self._created.get(key, 0) < self.pool_size:
+                self._created[key] = self._created.get(key, 0) + 1
+                create = True
+            else:
+                create = False
+
+        if create:
+            lang, oem, psm = key
+            return tesserocr.PyTessBaseAPI(lang=lang, oem=oem, psm=psm)
+        return pool.get()
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools = {}
+            self._created = {}
+        for pool in pools:
+            while True:
+                try:
+                    pool.get_nowait().End()
+                except queue.Empty:
+                    break
+
+
+def _parse_tesseract_config(config: str) -> tuple:
+    """Read (oem, psm) from a tesseract CLI config string."""
+    oem = re.search(r"--oem\s+(\d+)", config or "")
+    psm = re.search(r"--psm\s+(\d+)", config or "")
+    return (
+        int(oem.group(1)) if oem else tesserocr.OEM.DEFAULT,
+        int(psm.group(1)) if psm else tesserocr.PSM.AUTO,
+    )
+
+
+def get_ocr_backend(
+    backend: Union[str, object, None] = "auto", pool_size: int = 1
+):
+    """
+    Resolve an OCR backend.
+
+    Args:
+        backend: "auto" (tesserocr when installed, else pytesseract),
+            "tesserocr", "pytesseract", or an object with
+            image_to_string(image, lang, config) and close()
+        pool_size: Tesseract handles kept per language by the tesserocr backend
+
+    Returns:
+        Backend instance
+    """
+    if backend is None:
+        backend = "auto"
+    if not isinstance(backend, str):
+        return backend
+    if backend not in OCR_BACKENDS:
+        raise ValueError(f"ocr_backend must be one of {OCR_BACKENDS}, got {backend!r}")
+
+    if backend == "tesserocr" or (backend == "auto" and tesserocr is not None):
+        return TesserocrBackend(pool_size=pool_size)
+    return PytesseractBackend()
+
+
+def backend_for_workers(backend: Optional[object]) -> Union[str, object]:
+    """
+    What to send to worker processes to rebuild an equivalent backend.
+
+    Built-in backends hold Tesseract handles and locks, so only their name is
+    sent; custom backends are sent as they are and must be picklable.
+    """
+    if isinstance(backend, (PytesseractBackend, TesserocrBackend)):
+        return backend.name
+    if backend is None or isinstance(backend, str):
+        return backend or "auto"
+    return backend
+
+
+def check_worker_backend(backend: Optional[object]) -> None:
+    """Raise ValueError if `backend` cannot be sent to worker processes."""
+    spec = backend_for_workers(backend)
+    if isinstance(spec, str):
+        return
+    try:
+        pickle.dumps(spec)
+    except Exception as e:
+        raise ValueError(
+            f"Custom OCR backend {type(spec).__name__} must be picklable to be used "
+            f"with ocr_workers or executor_backend='process': {e}"
+        ) from e
@@ -1,15 +1,410 @@
+import asyncio
 import io
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, Union
+import math
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import fitz
-import pytesseract
 import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import PageOCRCache, extraction_cache_key, pixmap_digest
+from .instrumentation import add_timing
+from .ocr_backends import backend_for_workers, check_worker_backend, get_ocr_backend
 
 logger = logging.getLogger(__name__)
 
+EXECUTOR_BACKENDS = ("thread", "process")
+PDF_POINTS_PER_INCH = 72
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+TESSERACT_CONFIG = "--oem 3 --psm 6"
+# How often iter_text_batch checks whether queued items have started
+BATCH_POLL_INTERVAL = 0.05
+PAGE_CLASSES = ("native", "ocr", "blank")
+# (components, has alpha) -> PIL mode for pixmap samples
+_PIXMAP_MODES = {
+    (1, False): "L",
+    (2, True): "LA",
+    (3, False): "RGB",
+    (4, True): "RGBA",
+    (4, False): "CMYK",
+}
+
+# Analyzer owned by each batch worker process, built once by the initializer
+_worker_analyzer = None
+# Page OCR cache and OCR engine owned by each page OCR worker process
+_worker_page_cache = None
+_worker_ocr_backend = None
+
+
+class _LoadedPDF:
+    """PDF content held in memory (`data`) or in a file on disk (`path`)."""
+
+    def __init__(self, data=None, path: Optional[str] = None, temporary: bool = False):
+        self.data = data
+        self.path = path
+        self.temporary = temporary
+
+    @property
+    def source(self):
+        """Bytes-like object or file path accepted by _open_pdf."""
+        return self.path if self.path is not None else self.data
+
+    def close(self) -> None:
+        """Delete the spooled file, if any."""
+        if self.temporary and self.path is not None:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self.path = None
+
+
+class _SharedPDFRef(NamedTuple):
+    """Handle to PDF bytes placed in a shared memory block for a worker."""
+
+    name: str
+    size: int
+
+
+class ExtractionTimeout(TimeoutError):
+    """Raised inside an extraction once its deadline has passed."""
+
+
+def _check_deadline(deadline: Optional[float]) -> None:
+    """Stop an extraction whose `deadline` (a time.time() value) has passed."""
+    if deadline is not None and time.time() >= deadline:
+        raise ExtractionTimeout("PDF extraction deadline exceeded")
+
+
+def _error_result(error: str, timed_out: bool = False) -> Dict[str, Any]:
+    """Result returned for a document that could not be extracted."""
+    return {
+        "text": "",
+        "total_pages": 0,
+        "pages_with_text": 0,
+        "ocr_used": False,
+        "success": False,
+        "error": error,
+        "timed_out": timed_out,
+    }
+
+
+def _with_deadline(
+    extract_kwargs: Dict[str, Any], item_timeout: Optional[float]
+) -> Dict[str, Any]:
+    """Add a deadline `item_timeout` seconds from now, i.e. from when work starts."""
+    if item_timeout is None:
+        return extract_kwargs
+    return {**extract_kwargs, "deadline": time.time() + item_timeout}
+
+
+def _is_cacheable_source(pdf_source) -> bool:
+    """Whether the parent process can hash `pdf_source` without downloading it."""
+    if isinstance(pdf_source, (bytes, bytearray, memoryview)):
+        return len(pdf_source) > 0
+    return (
+        isinstance(pdf_source, str)
+        and not pdf_source.startswith(("http://", "https://"))
+        and os.path.isfile(pdf_source)
+    )
+
+
+def _select_pages(pages: Optional[Iterable[int]], total_pages: int) -> List[int]:
+    """Turn 1-based page numbers into sorted 0-based indexes inside the document."""
+    if pages is None:
+        return list(range(total_pages))
+    return sorted({number - 1 for number in pages if 1 <= number <= total_pages})
+
+
+def _page_record(
+    page_num: int, text: str, source: str, timings: Dict[str, float]
+) -> Dict[str, Any]:
+    """Structured result for one page; `page` is 1-based."""
+    text = text.strip()
+    return {
+        "page": page_num + 1,
+        "text": text,
+        "source": source,
+        "chars": len(text),
+        "seconds": round(sum(timings.values()), 4),
+        "timings": {phase: round(seconds, 4) for phase, seconds in timings.items()},
+    }
+
+
+def _page_section(record: Dict[str, Any]) -> str:
+    """Text block for one page record, headed by its `--- Page N ---` marker."""
+    label = f"Page {record['page']}"
+    if record["source"] == "ocr":
+        label += " (OCR)"
+    return f"\n--- {label} ---\n{record['text']}\n"
+
+
+def _classify_page(page, min_image_coverage: float) -> str:
+    """
+    Route a page to "native" text extraction, "ocr" or "blank" without
+    extracting its text.
+
+    Pages that reference fonts or carry form fields or annotations (whose
+    text lives in their own appearance streams) have a text layer. Other
+    pages are OCR'd when images cover at least `min_image_coverage` of the
+    page or when they hold vector drawings (outlined text), and skipped
+    otherwise.
+    """
+    if page.get_fonts():
+        return "native"
+    if page.first_widget is not None or page.first_annot is not None:
+        return "native"
+
+    page_area = abs(page.rect)
+    covered = sum(
+        abs(fitz.Rect(info["bbox"]) & page.rect) for info in page.get_image_info()
+    )
+    if covered and page_area and covered / page_area >= min_image_coverage:
+        return "ocr"
+    if page.get_drawings():
+        return "ocr"
+    return "blank"
+
+
+def _open_pdf(pdf_source):
+    """Open PDF bytes in place, or a file path through the filesystem."""
+    if isinstance(pdf_source, str):
+        return fitz.open(pdf_source, filetype="pdf")
+    return fitz.open(stream=pdf_source, filetype="pdf")
+
+
+def _pixmap_to_image(pix) -> Image.Image:
+    """
+    Wrap a pixmap's sample buffer in a PIL image without encoding it.
+
+    The image shares memory with the pixmap, so it must be closed before the
+    pixmap is released.
+    """
+    mode = _PIXMAP_MODES.get((pix.n, bool(pix.alpha)))
+    if mode is None:
+        # Unusual colorspaces: let PyMuPDF convert through PNG
+        return Image.open(io.BytesIO(pix.tobytes("png")))
+    return Image.frombuffer(
+        mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1
+    )
+
+
+def _render_zoom(page, dpi: int, max_pixels: Optional[int]) -> float:
+    """Zoom factor for rendering `page` at `dpi`, shrunk to fit `max_pixels`."""
+    zoom = dpi / PDF_POINTS_PER_INCH
+    page_area = page.rect.width * page.rect.height
+    if max_pixels and page_area > 0 and page_area * zoom * zoom > max_pixels:
+        zoom = math.sqrt(max_pixels / page_area)
+    return zoom
+
+
+def _render_page(page, ocr_options: Dict[str, Any]):
+    """Render a page for OCR following the analyzer's render policy."""
+    zoom = _render_zoom(page, ocr_options["dpi"], ocr_options["max_pixels"])
+    colorspace = fitz.csGRAY if ocr_options["grayscale"] else fitz.csRGB
+    return page.get_pixmap(
+        matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False
+    )
+
+
+def _binarize(image: Image.Image, threshold: int) -> Image.Image:
+    """Map pixels to pure black/white around `threshold` (0-255)."""
+    gray = image if image.mode == "L" else image.convert("L")
+    table = [0] * threshold + [255] * (256 - threshold)
+    binary = gray.point(table)
+    if gray is not image:
+        gray.close()
+    return binary
+
+
+def _render_and_ocr(
+    page,
+    ocr_options: Dict[str, Any],
+    ocr_backend,
+    page_cache: Optional[PageOCRCache] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> str:
+    """
+    Render a PDF page to an image and run Tesseract on it.
+
+    `ocr_options` comes from PDFAnalyzer._ocr_options() and `ocr_backend` from
+    ps_helper.pdf.ocr_backends.get_ocr_backend(). When a page cache is
+    given, pages whose rendered pixels were already OCR'd with the same
+    settings are answered from the cache. Render and OCR seconds are added
+    to `timings` when given.
+    """
+    if timings is None:
+        timings = {}
+    start = time.perf_counter()
+    pix = _render_page(page, ocr_options)
+    ocr_language = ocr_options["ocr_language"]
+    threshold = ocr_options["binarize_threshold"]
+
+    page_key = None
+    if page_cache is not None:
+        page_key = pixmap_digest(
+            pix,
+            {
+                "ocr_language": ocr_language,
+                "config": TESSERACT_CONFIG,
+                "binarize_threshold": threshold,
+            },
+        )
+        cached = page_cache.get(page_key)
+        if cached is not None:
+            add_timing(timings, "render", time.perf_counter() - start)
+            return cached
+
+    rendered = time.perf_counter()
+    add_timing(timings, "render", rendered - start)
+    image = _pixmap_to_image(pix)
+    if threshold is not None:
+        binary = _binarize(image, threshold)
+        image.close()
+        image = binary
+
+    # OCR
+    try:
+        text = ocr_backend.image_to_string(
+            image, lang=ocr_language, config=TESSERACT_CONFIG
+        )
+    finally:
+        # Drop the view on the pixmap samples before the pixmap is freed
+        image.close()
+        add_timing(timings, "ocr", time.perf_counter() - rendered)
+
+    if page_key is not None:
+        page_cache.set(page_key, text)
+    return text
+
+
+def _ocr_pages_worker(
+    pdf_source: Union[str, _SharedPDFRef],
+    page_numbers: List[int],
+    ocr_options: Dict[str, Any],
+    ocr_backend="auto",
+    page_cache_entries: Optional[int] = None,
+) -> Tuple[List[tuple], int, int]:
+    """
+    OCR a subset of pages of one document inside a worker process.
+
+    The document (a file path or bytes in shared memory) is opened once per
+    task so every page in the chunk reuses it.
+    Returns (page_number, text, timings) tuples, where failed pages yield
+    empty text and timings maps render/ocr to seconds, plus the page cache
+    hits and misses counted by this task.
+    """
+    global _worker_page_cache, _worker_ocr_backend
+    if _worker_ocr_backend is None:
+        # Built once per process so Tesseract models stay loaded between tasks
+        _worker_ocr_backend = get_ocr_backend(ocr_backend)
+    page_cache = None
+    if page_cache_entries:
+        if _worker_page_cache is None:
+            _worker_page_cache = PageOCRCache(max_entries=page_cache_entries)
+        page_cache = _worker_page_cache
+    hits_before = page_cache.hits if page_cache is not None else 0
+    misses_before = page_cache.misses if page_cache is not None else 0
+
+    shm = view = None
+    if isinstance(pdf_source, _SharedPDFRef):
+        shm = shared_memory.SharedMemory(name=pdf_source.name)
+        view = pdf_source = shm.buf[: pdf_source.size]
+    doc = _open_pdf(pdf_source)
+    try:
+        results = []
+        for page_num in page_numbers:
+            timings = {}
+            try:
+                text = _render_and_ocr(
+                    doc[page_num],
+                    ocr_options,
+                    _worker_ocr_backend,
+                    page_cache,
+                    timings,
+                )
+            except Exception as e:
+                logger.warning(f"OCR failed for page {page_num + 1}: {str(e)}")
+                text = ""
+            results.append((page_num, text, timings))
+    finally:
+        doc.close()
+        if shm is not None:
+            view.release()
+            shm.close()
+
+    if page_cache is None:
+        return results, 0, 0
+    return (
+        results,
+        page_cache.hits - hits_before,
+        page_cache.misses - misses_before,
+    )
+
+
+def _init_batch_worker(
+    config: Dict[str, Any],
+    page_cache_entries: Optional[int] = None,
+    ready_workers=None,
+) -> None:
+    """Build the analyzer used by a batch worker process and count it as ready."""
+    global _worker_analyzer
+    page_cache = PageOCRCache(page_cache_entries) if page_cache_entries else None
+    _worker_analyzer = PDFAnalyzer(**config, page_cache=page_cache)
+    if ready_workers is not None:
+        with ready_workers.get_lock():
+            ready_workers.value += 1
+
+
+def _extract_in_worker(
+    pdf_source: Union[str, _SharedPDFRef],
+    extract_kwargs: Dict[str, Any],
+    item_timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Run extract_text_from_pdf in a batch worker process."""
+    extract_kwargs = _with_deadline(extract_kwargs, item_timeout)
+    if not isinstance(pdf_source, _SharedPDFRef):
+        return _worker_analyzer.extract_text_from_pdf(pdf_source, **extract_kwargs)
+
+    shm = shared_memory.SharedMemory(name=pdf_source.name)
+    # PyMuPDF reads the memoryview in place, so the bytes are never copied
+    view = shm.buf[: pdf_source.size]
+    try:
+        return _worker_analyzer.extract_text_from_pdf(view, **extract_kwargs)
+    finally:
+        view.release()
+        shm.close()
+
 
 class PDFAnalyzer:
     def __init__(
@@ -18,6 +413,22 @@ class PDFAnalyzer:
         ocr_language: str = "eng+spa",
         max_workers: int = 4,
         timeout: int = 30,
+        ocr_workers: Optional[int] = None,
+        executor_backend: str = "thread",
+        cache=None,
+        page_cache: Optional[PageOCRCache] = None,
+        ocr_dpi: int = 144,
+        ocr_max_pixels: Optional[int] = 9_000_000,
+        ocr_grayscale: bool = False,
+        ocr_binarize_threshold: Optional[int] = None,
+        ocr_backend="auto",
+        max_download_bytes: Optional[int] = None,
+        spool_threshold_bytes: int = 32 * 1024 * 1024,
+        download_retries: int = 3,
+        retry_backoff: float = 0.5,
+        probe_text_layer: bool = True,
+        min_image_coverage: float = 0.01,
+        instrumentation=None,
     ):
         """
         Initialize PDF analyzer with configuration options.
@@ -27,133 +438,993 @@ class PDFAnalyzer:
             ocr_language: Tesseract language codes (e.g., 'eng', 'spa', 'eng+spa')
             max_workers: Maximum threads for parallel processing
             timeout: Request timeout in seconds
+            ocr_workers: Processes used to OCR the image-only pages of a single
+                document in parallel. None or 1 keeps OCR sequential.
+            executor_backend: "thread" or "process" pool for extract_text_batch
+            cache: Optional result cache keyed by PDF content and OCR settings
+                (e.g. MemoryLRUCache, DiskCache or TieredCache from
+                ps_helper.pdf.cache). Any object with get(key)/set(key, value).
+            page_cache: Optional PageOCRCache so pages that render to the same
+                pixels (cover sheets, boilerplate) are OCR'd only once
+            ocr_dpi: Target resolution used to render pages for OCR. The
+                default matches the previous fixed 2x render scale; 300 is
+                Tesseract's sweet spot but renders about 4x the pixels.
+            ocr_max_pixels: Pixel budget per rendered page. Pages that would
+                exceed it at `ocr_dpi` (large-format plans) are rendered at a
+                lower resolution. None disables the cap.
+            ocr_grayscale: Render OCR pages in grayscale instead of RGB
+            ocr_binarize_threshold: Optional 0-255 threshold to convert pages
+                to black and white before OCR
+            ocr_backend: "auto", "tesserocr", "pytesseract" or a custom backend
+                object (see ps_helper.pdf.ocr_backends). "auto" keeps Tesseract
+                models loaded through tesserocr when it is installed and falls
+                back to the pytesseract CLI otherwise. Custom backends are
+                copied to worker processes and must be picklable when
+                `ocr_workers` or the process backend is used.
+            max_download_bytes: Abort downloads larger than this many bytes.
+                None means no limit.
+            spool_threshold_bytes: Downloads larger than this are streamed to
+                a temporary file and opened from disk instead of memory
+            download_retries: Retries for failed connections and 429/5xx
+                responses when downloading PDFs
+            retry_backoff: Exponential backoff factor between retries, in seconds
+            probe_text_layer: Classify pages from their fonts, images and
+                drawings before extracting, so image-only pages go straight
+                to OCR and blank pages are skipped
+            min_image_coverage: Fraction of a font-less page that images must
+                cover for the probe to send it to OCR
+            instrumentation: Optional hook receiving the phase timings of every
+                extracted document, e.g. PDFTimingStats from
+                ps_helper.pdf.instrumentation. Any object with
+                record(timings, page_timings).
         """
+        if executor_backend not in EXECUTOR_BACKENDS:
+            raise ValueError(
+                f"executor_backend must be one of {EXECUTOR_BACKENDS}, "
+                f"got {executor_backend!r}"
+            )
+        threshold = ocr_binarize_threshold
+        if threshold is not None and not 0 <= threshold <= 255:
+            raise ValueError("ocr_binarize_threshold must be between 0 and 255")
+
         self.ocr_enabled = ocr_enabled
         self.ocr_language = ocr_language
         self.max_workers = max_workers
         self.timeout = timeout
+        self.ocr_workers = ocr_workers
+        self.executor_backend = executor_backend
+        self.cache = cache
+        self.page_cache = page_cache
+        self.ocr_dpi = ocr_dpi
+        self.ocr_max_pixels = ocr_max_pixels
+        self.ocr_grayscale = ocr_grayscale
+        self.ocr_binarize_threshold = ocr_binarize_threshold
+        self.ocr_backend = get_ocr_backend(ocr_backend, pool_size=max_workers)
+        if (ocr_workers and ocr_workers > 1) or executor_backend == "process":
+            check_worker_backend(self.ocr_backend)
+        self.max_download_bytes = max_download_bytes
+        self.spool_threshold_bytes = spool_threshold_bytes
+        self.download_retries = download_retries
+        self.retry_backoff = retry_backoff
+        self.probe_text_layer = probe_text_layer
+        self.min_image_coverage = min_image_coverage
+        self.instrumentation = instrumentation
+        self._session = None
+        self._session_lock = threading.Lock()
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._ocr_pool = None
+        self._process_executor = None
+        self._pool_lock = threading.Lock()
+        self._ready_workers = None
 
     def extract_text_from_pdf(
-        self, pdf_source: Union[str, bytes], use_ocr_fallback: bool = True
+        self,
+        pdf_source: Union[str, bytes, memoryview],
+        use_ocr_fallback: bool = True,
+        pages: Optional[Iterable[int]] = None,
+        max_chars: Optional[int] = None,
+        stop_when: Optional[Callable[[str], bool]] = None,
+        structured: bool = False,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Extract text from PDF with fallback to OCR for images.
 
         Args:
-            pdf_source: PDF URL, file path, or bytes
+            pdf_source: PDF URL, file path, or bytes (any bytes-like object)
             use_ocr_fallback: Use OCR if no text found
+            pages: 1-based page numbers to extract (e.g. range(1, 4) or [1, 5]).
+                None extracts every page.
+            max_chars: Stop once this many characters were extracted; the
+                returned text is cut to this length
+            stop_when: Predicate called with each page's text; extraction stops
+                after the first page for which it returns True
+            structured: Also return a "pages" list with one record per
+                processed page (page, text, source, chars, seconds)
+            deadline: time.time() value after which the extraction gives up.
+                It is checked while downloading and before every page, and a
+                late document returns an error result with "timed_out": True.
 
         Returns:
             Dict with extracted text and metadata
         """
+        if pages is not None:
+            # Read once: the cache key and the page selection both need it
+            pages = list(pages)
+        loaded = None
         try:
-            pdf_bytes = self._get_pdf_bytes(pdf_source)
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+            start = time.perf_counter()
+            loaded = self._load_pdf(pdf_source, deadline)
+            timings = {"download": time.perf_counter() - start}
+
+            cache_key = None
+            settings = self._extraction_settings(
+                use_ocr_fallback, pages, max_chars, stop_when, structured
+            )
+            if self.cache is not None and settings is not None:
+                cache_key = self._cache_key(loaded.source, settings)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            result = self._extract_document(
+                loaded.source,
+                use_ocr_fallback,
+                pages,
+                max_chars,
+                stop_when,
+                structured,
+                timings,
+                deadline,
+            )
+
+            if cache_key is not None:
+                self.cache.set(cache_key, result)
+            return result
+
+        except ExtractionTimeout as e:
+            logger.warning(f"PDF extraction timed out: {str(e)}")
+            return _error_result(str(e), timed_out=True)
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF: {str(e)}")
+            return _error_result(str(e))
+        finally:
+            if loaded is not None:
+                loaded.close()
+
+    def _extract_document(
+        self,
+        pdf_source,
+        use_ocr_fallback: bool,
+        pages: Optional[Iterable[int]] = None,
+        max_chars: Optional[int] = None,
+        stop_when: Optional[Callable[[str], bool]] = None,
+        structured: bool = False,
+        timings: Optional[Dict[str, float]] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Extract native text and OCR fallback text from loaded PDF content.
+
+        `timings` holds phases measured before the document was opened
+        (download); the rest are added here and reported to the
+        instrumentation hook. Raises ExtractionTimeout past `deadline`.
+        """
+        timings = dict(timings or {})
+        ocr_allowed = self.ocr_enabled and use_ocr_fallback
+        records = {}
+        page_classes = dict.fromkeys(PAGE_CLASSES, 0) if self.probe_text_layer else None
+        stopped_early = False
 
-            extracted_text = ""
+        start = time.perf_counter()
+        with _open_pdf(pdf_source) as doc:
             total_pages = len(doc)
-            pages_with_text = 0
-            ocr_used = False
-
-            for page_num in range(total_pages):
-                page = doc[page_num]
-                page_text = page.get_text().strip()
-
-                if page_text:
-                    extracted_text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
-                    pages_with_text += 1
-                elif self.ocr_enabled and use_ocr_fallback:
-                    ocr_text = self._extract_text_with_ocr(page)
-                    if ocr_text.strip():
-                        extracted_text += (
-                            f"\n--- Page {page_num + 1} (OCR) ---\n{ocr_text}\n"
+            page_numbers = _select_pages(pages, total_pages)
+            add_timing(timings, "open", time.perf_counter() - start)
+
+            if max_chars is None and stop_when is None:
+                # Whole-range mode: native pass first, then OCR the image-only
+                # pages together so they can be spread over ocr_workers
+                ocr_pages = {}
+                for page_num in page_numbers:
+                    _check_deadline(deadline)
+                    page_text, source, page_timings = self._native_pass(
+                        doc[page_num], page_classes, ocr_allowed
+                    )
+                    if source == "ocr":
+                        ocr_pages[page_num] = page_timings
+                        continue
+                    records[page_num] = _page_record(
+                        page_num, page_text, source, page_timings
+                    )
+
+                for page_num, ocr_text, ocr_timings in self._ocr_pages(
+                    doc, pdf_source, list(ocr_pages), deadline
+                ):
+                    records[page_num] = _page_record(
+                        page_num, ocr_text, "ocr", {**ocr_pages[page_num], **ocr_timings}
+                    )
+            else:
+                # Early-stop mode: pages are finished one by one, in order,
+                # so the condition is checked before any later page is touched
+                extracted_chars = 0
+                for page_num in page_numbers:
+                    _check_deadline(deadline)
+                    page_text, source, page_timings = self._native_pass(
+                        doc[page_num], page_classes, ocr_allowed
+                    )
+                    if source == "ocr":
+                        page_text = self._extract_text_with_ocr(
+                            doc[page_num], page_timings
                         )
-                        ocr_used = True
+                    record = _page_record(page_num, page_text, source, page_timings)
+                    records[page_num] = record
+                    if record["chars"]:
+                        extracted_chars += len(_page_section(record))
 
-            doc.close()
+                    if (max_chars is not None and extracted_chars >= max_chars) or (
+                        stop_when is not None and stop_when(record["text"])
+                    ):
+                        stopped_early = len(records) < len(page_numbers)
+                        break
 
-            return {
-                "text": extracted_text.strip(),
-                "total_pages": total_pages,
-                "pages_with_text": pages_with_text,
-                "ocr_used": ocr_used,
-                "success": True,
-                "error": None,
-            }
+        page_records = [records[page_num] for page_num in sorted(records)]
+        for record in page_records:
+            for phase, seconds in record["timings"].items():
+                add_timing(timings, phase, seconds)
+        if self.instrumentation is not None:
+            try:
+                self.instrumentation.record(
+                    timings, [record["timings"] for record in page_records]
+                )
+            except Exception as e:
+                logger.warning(f"PDF instrumentation hook failed: {str(e)}")
+        extracted_text = "".join(
+            _page_section(record) for record in page_records if record["chars"]
+        ).strip()
+        if max_chars is not None:
+            extracted_text = extracted_text[:max_chars]
+
+        result = {
+            "text": extracted_text,
+            "total_pages": total_pages,
+            "pages_with_text": sum(
+                1 for record in page_records
+                if record["source"] == "native" and record["chars"]
+            ),
+            "pages_processed": len(page_records),
+            "stopped_early": stopped_early,
+            "page_classes": page_classes,
+            "ocr_used": any(
+                record["source"] == "ocr" and record["chars"]
+                for record in page_records
+            ),
+            "timings": {phase: round(seconds, 4) for phase, seconds in timings.items()},
+            "success": True,
+            "error": None,
+        }
+        if structured:
+            result["pages"] = page_records
+        return result
+
+    def _native_pass(
+        self, page, page_classes: Optional[Dict[str, int]], ocr_allowed: bool
+    ) -> Tuple[str, str, Dict[str, float]]:
+        """
+        Probe a page and read its text layer when it has one.
+
+        Returns (text, source, timings), where source is "native", "blank",
+        or "ocr" for pages that still have to be OCR'd.
+        """
+        start = time.perf_counter()
+        page_class = self._classify_page(page, page_classes)
+        page_text = ""
+        if page_class == "native" or (page_class == "ocr" and not ocr_allowed):
+            page_text = page.get_text().strip()
+        source = "blank" if page_class == "blank" else "native"
+        if not page_text and page_class != "blank" and ocr_allowed:
+            source = "ocr"
+        return page_text, source, {"native_text": time.perf_counter() - start}
 
+    def _classify_page(self, page, page_classes: Optional[Dict[str, int]]) -> str:
+        """Probe a page and count its class; "native" when probing is off."""
+        if page_classes is None:
+            return "native"
+        try:
+            page_class = _classify_page(page, self.min_image_coverage)
         except Exception as e:
-            logger.error(f"Error extracting text from PDF: {str(e)}")
-            return {
-                "text": "",
-                "total_pages": 0,
-                "pages_with_text": 0,
-                "ocr_used": False,
-                "success": False,
-                "error": str(e),
-            }
-
-    def _get_pdf_bytes(self, pdf_source: Union[str, bytes]) -> bytes:
-        """Get PDF bytes from various sources."""
-        if isinstance(pdf_source, bytes):
-            return pdf_source
+            logger.warning(f"Text-layer probe failed for page: {str(e)}")
+            page_class = "native"
+        page_classes[page_class] += 1
+        return page_class
+
+    @staticmethod
+    def _extraction_settings(
+        use_ocr_fallback: bool = True,
+        pages: Optional[Iterable[int]] = None,
+        max_chars: Optional[int] = None,
+        stop_when: Optional[Callable[[str], bool]] = None,
+        structured: bool = False,
+        deadline: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Per-call options that shape the result, for the cache key.
+
+        Returns None when the result cannot be cached (arbitrary predicates).
+        `deadline` does not change a successful result and is ignored.
+        """
+        if stop_when is not None:
+            return None
+        return {
+            "use_ocr_fallback": use_ocr_fallback,
+            "pages": sorted(set(pages)) if pages is not None else None,
+            "max_chars": max_chars,
+            "structured": structured,
+        }
+
+    def _cache_key(self, pdf_source, settings: Dict[str, Any]) -> str:
+        """Cache key for the PDF content under the current OCR settings."""
+        return extraction_cache_key(
+            pdf_source,
+            {
+                "ocr_enabled": self.ocr_enabled,
+                "tesseract_config": TESSERACT_CONFIG,
+                "probe_text_layer": self.probe_text_layer,
+                "min_image_coverage": self.min_image_coverage,
+                **self._ocr_options(),
+                **settings,
+            },
+        )
+
+    def _ocr_options(self) -> Dict[str, Any]:
+        """Render and OCR settings, in a form that can be sent to workers."""
+        return {
+            "ocr_language": self.ocr_language,
+            "dpi": self.ocr_dpi,
+            "max_pixels": self.ocr_max_pixels,
+            "grayscale": self.ocr_grayscale,
+            "binarize_threshold": self.ocr_binarize_threshold,
+        }
+
+    def _load_pdf(
+        self,
+        pdf_source: Union[str, bytes, memoryview],
+        deadline: Optional[float] = None,
+    ) -> _LoadedPDF:
+        """Get PDF content from various sources."""
+        if isinstance(pdf_source, (bytes, memoryview)):
+            return _LoadedPDF(data=pdf_source)
+        elif isinstance(pdf_source, bytearray):
+            return _LoadedPDF(data=bytes(pdf_source))
         elif isinstance(pdf_source, str):
             if pdf_source.startswith(("http://", "https://")):
-                # Download from URL
-                response = requests.get(pdf_source, timeout=self.timeout)
-                response.raise_for_status()
-                return response.content
+                return self._download_pdf(pdf_source, deadline)
             else:
-                # Read from file path
-                with open(pdf_source, "rb") as f:
-                    return f.read()
+                # PyMuPDF reads local files on demand, so they are not copied
+                # into memory first
+                if not os.path.isfile(pdf_source):
+                    raise FileNotFoundError(f"No such PDF file: {pdf_source}")
+                return _LoadedPDF(path=pdf_source)
         else:
             raise ValueError("pdf_source must be URL, file path, or bytes")
 
-    def _extract_text_with_ocr(self, page) -> str:
-        """Extract text from PDF page using OCR."""
-        try:
-            # Get page as image
-            mat = fitz.Matrix(2.0, 2.0)  # Scale for better OCR
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("png")
+    def _download_pdf(self, url: str, deadline: Optional[float] = None) -> _LoadedPDF:
+        """
+        Stream a remote PDF, enforcing max_download_bytes and `deadline`.
+
+        Small files stay in memory; once spool_threshold_bytes is crossed the
+        download continues into a temporary file that PyMuPDF opens from disk.
+        """
+        timeout = self.timeout
+        if deadline is not None:
+            _check_deadline(deadline)
+            timeout = min(timeout, deadline - time.time())
+        session = self._get_session()
+        with session.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+
+            declared_size = response.headers.get("Content-Length")
+            if declared_size and declared_size.isdigit():
+                self._check_download_size(int(declared_size), url)
+
+            chunks = []
+            size = 0
+            spool = None
+            try:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    size += len(chunk)
+                    self._check_download_size(size, url)
+                    _check_deadline(deadline)
+
+                    if spool is not None:
+                        spool.write(chunk)
+                        continue
+                    chunks.append(chunk)
+                    if size > self.spool_threshold_bytes:
+                        spool = tempfile.NamedTemporaryFile(
+                            prefix="ps_helper_", suffix=".pdf", delete=False
+                        )
+                        spool.writelines(chunks)
+                        chunks = []
+            except Exception:
+                if spool is not None:
+                    spool.close()
+                    os.remove(spool.name)
+                raise
 
-            # Convert to PIL Image
-            image = Image.open(io.BytesIO(img_data))
+        if spool is None:
+            return _LoadedPDF(data=b"".join(chunks))
+        spool.close()
+        return _LoadedPDF(path=spool.name, temporary=True)
 
-            # OCR
-            text = pytesseract.image_to_string(
-                image, lang=self.ocr_language, config="--oem 3 --psm 6"
+    def _get_session(self) -> requests.Session:
+        """
+        Shared keep-alive session for PDF downloads, created on first use.
+
+        Each host gets a connection pool sized to max_workers so parallel batch
+        downloads from one origin reuse connections instead of reconnecting.
+        """
+        with self._session_lock:
+            if self._session is None:
+                retry = Retry(
+                    total=self.download_retries,
+                    backoff_factor=self.retry_backoff,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    allowed_methods=frozenset(["GET", "HEAD"]),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=max(10, self.max_workers),
+                    pool_maxsize=self.max_workers,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def _check_download_size(self, size: int, url: str) -> None:
+        if self.max_download_bytes is not None and size > self.max_download_bytes:
+            raise ValueError(
+                f"PDF at {url} exceeds max_download_bytes "
+                f"({size} > {self.max_download_bytes})"
             )
 
-            return text
+    def _ocr_pages(
+        self,
+        doc,
+        pdf_source,
+        page_numbers: List[int],
+        deadline: Optional[float] = None,
+    ) -> List[tuple]:
+        """
+        OCR the given pages, in parallel across processes when enabled.
+
+        Returns (page_number, text, timings) tuples in page order. Raises
+        ExtractionTimeout once `deadline` has passed.
+        """
+        if self.ocr_workers and self.ocr_workers > 1 and len(page_numbers) > 1:
+            try:
+                return self._ocr_pages_parallel(pdf_source, page_numbers, deadline)
+            except ExtractionTimeout:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Parallel OCR failed, falling back to sequential: {str(e)}"
+                )
+
+        results = []
+        for page_num in page_numbers:
+            _check_deadline(deadline)
+            timings = {}
+            text = self._extract_text_with_ocr(doc[page_num], timings)
+            results.append((page_num, text, timings))
+        return results
+
+    def _ocr_pages_parallel(
+        self, pdf_source, page_numbers: List[int], deadline: Optional[float] = None
+    ) -> List[tuple]:
+        """Spread page OCR over the process pool, one chunk of pages per task."""
+        pool = self._get_ocr_pool()
+        chunk_count = min(self.ocr_workers, len(page_numbers))
+        # Interleave pages so expensive runs of pages are shared between workers
+        chunks = [page_numbers[i::chunk_count] for i in range(chunk_count)]
+        page_cache_entries = self._page_cache_entries()
+
+        # Bytes are copied once into shared memory that every chunk task
+        # reads in place, instead of being pickled into each task
+        shm = None
+        if not isinstance(pdf_source, str):
+            size = len(pdf_source)
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            shm.buf[:size] = pdf_source
+            pdf_source = _SharedPDFRef(shm.name, size)
+
+        futures = []
+        try:
+            for chunk in chunks:
+                futures.append(
+                    pool.submit(
+                        _ocr_pages_worker,
+                        pdf_source,
+                        chunk,
+                        self._ocr_options(),
+                        backend_for_workers(self.ocr_backend),
+                        page_cache_entries,
+                    )
+                )
+        except BrokenProcessPool:
+            self._discard_ocr_pool(pool)
+            raise
+        finally:
+            if shm is not None:
+                self._release_shared_pdf(shm, *futures)
+
+        results = []
+        for future in futures:
+            try:
+                chunk_results, hits, misses = future.result(
+                    timeout=None if deadline is None else max(0, deadline - time.time())
+                )
+            except FutureTimeoutError:
+                # Chunks that have not started yet are dropped
+                for pending in futures:
+                    pending.cancel()
+                raise ExtractionTimeout("PDF extraction deadline exceeded")
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory); the pool cannot be reused
+                self._discard_ocr_pool(pool)
+                raise
+            results.extend(chunk_results)
+            if self.page_cache is not None:
+                self.page_cache.record_hits(hits, misses)
+        results.sort(key=lambda item: item[0])
+        return results
+
+    def _get_ocr_pool(self) -> ProcessPoolExecutor:
+        """Create the page OCR process pool on first use."""
+        with self._pool_lock:
+            if self._ocr_pool is None:
+                # spawn avoids forking a process that already runs executor threads
+                self._ocr_pool = ProcessPoolExecutor(
+                    max_workers=self.ocr_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._ocr_pool
+
+    def _discard_ocr_pool(self, pool) -> None:
+        """Drop a broken OCR pool so the next document builds a new one."""
+        with self._pool_lock:
+            if self._ocr_pool is pool:
+                self._ocr_pool = None
+        pool.shutdown(wait=False)
+
+    def _page_cache_entries(self) -> Optional[int]:
+        """Page cache size for worker processes, which keep their own cache."""
+        if self.page_cache is None:
+            return None
+        return self.page_cache.max_entries
+
+    def _extract_text_with_ocr(
+        self, page, timings: Optional[Dict[str, float]] = None
+    ) -> str:
+        """Extract text from PDF page using OCR."""
+        try:
+            return _render_and_ocr(
+                page, self._ocr_options(), self.ocr_backend, self.page_cache, timings
+            )
 
         except Exception as e:
             logger.warning(f"OCR failed for page: {str(e)}")
             return ""
 
-    def extract_text_batch(self, pdf_sources: list) -> list:
+    async def aextract_text_from_pdf(
+        self,
+        pdf_source: Union[str, bytes, memoryview],
+        use_ocr_fallback: bool = True,
+        **extract_kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Async version of extract_text_from_pdf for `async def` callbacks.
+
+        The extraction runs on the analyzer's thread or process pool and is
+        awaited, so the event loop (and Scrapy's asyncio reactor) keeps
+        serving other requests while a heavy document is parsed or OCR'd.
+        Requires a running asyncio event loop, e.g. Scrapy with
+        TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor".
+
+        Args:
+            pdf_source: PDF URL, file path, or bytes
+            use_ocr_fallback: Use OCR if no text found
+            **extract_kwargs: Forwarded to extract_text_from_pdf (pages,
+                max_chars, stop_when, structured, ...) or `item_timeout`
+
+        Returns:
+            Dict with extracted text and metadata
+        """
+        future, shm = self._submit_batch_item(
+            pdf_source, use_ocr_fallback=use_ocr_fallback, **extract_kwargs
+        )
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            if shm is not None:
+                self._release_shared_pdf(shm, future)
+
+    def submit_extraction(
+        self, pdf_source, item_timeout: Optional[float] = None, **extract_kwargs
+    ) -> Future:
+        """
+        Queue one extraction on the analyzer's pool without waiting for it.
+
+        Args:
+            pdf_source: PDF URL, file path, or bytes
+            item_timeout: Seconds the extraction may take once it starts; a
+                late document stops at its next page with "timed_out": True.
+                None means no limit.
+            **extract_kwargs: Forwarded to extract_text_from_pdf
+
+        Returns:
+            concurrent.futures.Future resolving to the result dict
+        """
+        future, shm = self._submit_batch_item(
+            pdf_source, item_timeout=item_timeout, **extract_kwargs
+        )
+        if shm is not None:
+            self._release_shared_pdf(shm, future)
+        return future
+
+    def extract_text_batch(
+        self,
+        pdf_sources: Iterable,
+        max_in_flight: Optional[int] = None,
+        item_timeout: Optional[float] = None,
+    ) -> list:
         """
         Extract text from multiple PDFs in parallel.
         Optimized for Scrapy's concurrent processing.
+
+        Uses the thread or process pool selected by `executor_backend`, with
+        the same bounded in-flight window as iter_text_batch.
+        Results are returned in the same order as `pdf_sources`.
+
+        Args:
+            pdf_sources: Iterable of PDF URLs, file paths, or bytes
+            max_in_flight: Maximum pending extractions (default: 2 * max_workers)
+            item_timeout: Seconds each document may take, counted from when
+                work on it starts (default: `timeout`)
         """
-        futures = []
-        for pdf_source in pdf_sources:
-            future = self._executor.submit(self.extract_text_from_pdf, pdf_source)
-            futures.append(future)
+        results = {}
+        for index, result in self.iter_text_batch(
+            pdf_sources,
+            max_in_flight=max_in_flight,
+            item_timeout=self.timeout if item_timeout is None else item_timeout,
+        ):
+            results[index] = result
+        return [results[index] for index in range(len(results))]
 
-        results = []
-        for future in futures:
+    def iter_text_batch(
+        self,
+        pdf_sources: Iterable,
+        max_in_flight: Optional[int] = None,
+        item_timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Extract text from many PDFs, yielding each result as soon as it is ready.
+
+        Sources are pulled lazily and at most `max_in_flight` of them are queued
+        or running at a time, so generators of tens of thousands of URLs keep
+        memory flat.
+
+        With `item_timeout`, every document gets a deadline when work on it
+        starts, so time spent waiting in the queue does not count. A late
+        document stops at its next page boundary; its error result (with
+        "timed_out": True) is yielded at the deadline and its slot is given
+        to the next source.
+
+        Args:
+            pdf_sources: Iterable of PDF URLs, file paths, or bytes
+            max_in_flight: Maximum pending extractions (default: 2 * max_workers)
+            item_timeout: Seconds each document may take. None means no limit.
+
+        Yields:
+            (index, result) tuples in completion order, where index is the
+            position of the source in `pdf_sources`
+        """
+        limit = max(1, max_in_flight or self.max_workers * 2)
+        sources = enumerate(pdf_sources)
+        in_flight = {}
+        # Start times of in-flight items seen running, and timed-out items
+        # whose task has not returned yet and still holds a worker
+        started = {}
+        abandoned = set()
+
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(in_flight) < limit:
+                    try:
+                        index, pdf_source = next(sources)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    try:
+                        future, shm = self._submit_batch_item(
+                            pdf_source, item_timeout=item_timeout
+                        )
+                    except Exception as e:
+                        logger.error(f"Batch submission error: {str(e)}")
+                        yield index, _error_result(str(e))
+                        continue
+                    in_flight[future] = (index, shm)
+
+                if not in_flight:
+                    break
+
+                wait_timeout = None
+                if item_timeout is not None:
+                    abandoned = {future for future in abandoned if not future.done()}
+                    now = time.time()
+                    # Futures can be marked running while waiting for a worker
+                    # process (queued or still starting), so no more items
+                    # count as started than there are workers to run them
+                    slots = self._batch_slots()
+                    for future in in_flight:
+                        if len(started) + len(abandoned) >= slots:
+                            break
+                        if future not in started and future.running():
+                            started[future] = now
+                    if started:
+                        wait_timeout = max(0, min(started.values()) + item_timeout - now)
+                    if len(started) < len(in_flight):
+                        wait_timeout = min(
+                            BATCH_POLL_INTERVAL,
+                            BATCH_POLL_INTERVAL if wait_timeout is None else wait_timeout,
+                        )
+
+                done, _ = wait(
+                    in_flight, timeout=wait_timeout, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    index, shm = in_flight.pop(future)
+                    started.pop(future, None)
+                    if shm is not None:
+                        self._release_shared_pdf(shm, future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Batch processing error: {str(e)}")
+                        result = _error_result(str(e))
+                    yield index, result
+
+                # Items that finished while the consumer was busy are past
+                # their deadline by now but still have a result; the next
+                # wait collects them
+                now = time.time()
+                expired = [
+                    future
+                    for future, start in started.items()
+                    if start + item_timeout <= now and not future.done()
+                ]
+                for future in expired:
+                    index, shm = in_flight.pop(future)
+                    del started[future]
+                    abandoned.add(future)
+                    if shm is not None:
+                        self._release_shared_pdf(shm, future)
+                    logger.warning(f"Batch item {index} timed out after {item_timeout}s")
+                    yield index, _error_result(
+                        f"PDF extraction timed out after {item_timeout}s",
+                        timed_out=True,
+                    )
+        finally:
+            # Consumer stopped early: drop queued work and free shared blocks
+            for future, (_, shm) in in_flight.items():
+                future.cancel()
+                if shm is not None:
+                    self._release_shared_pdf(shm, future)
+
+    def _submit_batch_item(
+        self, pdf_source, item_timeout: Optional[float] = None, **extract_kwargs
+    ):
+        """
+        Submit one source to the configured executor.
+
+        `extract_kwargs` are forwarded to extract_text_from_pdf. With
+        `item_timeout`, the task sets its own deadline when it starts.
+
+        Returns (future, shared_memory). Bytes sent to the process backend are
+        placed in shared memory once instead of being pickled per task; the
+        block must be released with _release_shared_pdf when the task ends.
+        """
+        if self.executor_backend == "thread":
+            future = self._executor.submit(
+                self._extract_with_timeout, pdf_source, extract_kwargs, item_timeout
+            )
+            return future, None
+
+        executor = self._get_process_executor()
+        in_memory = isinstance(pdf_source, (bytes, bytearray, memoryview))
+        if extract_kwargs.get("pages") is not None:
+            # Generators cannot be pickled and would be consumed by the cache key
+            extract_kwargs = {**extract_kwargs, "pages": list(extract_kwargs["pages"])}
+
+        # Worker analyzers have no cache, so bytes and local files are looked
+        # up here instead. URLs are only fetched inside the worker and are
+        # not cached with this backend.
+        cache_key = None
+        settings = self._extraction_settings(**extract_kwargs)
+        if self.cache is not None and settings is not None and _is_cacheable_source(pdf_source):
+            cache_key = self._cache_key(pdf_source, settings)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                future = Future()
+                future.set_result(cached)
+                return future, None
+
+        shm = None
+        if in_memory and len(pdf_source):
+            size = len(pdf_source)
+            shm = shared_memory.SharedMemory(create=True, size=size)
             try:
-                result = future.result(timeout=self.timeout)
-                results.append(result)
+                shm.buf[:size] = pdf_source
+                future = executor.submit(
+                    _extract_in_worker,
+                    _SharedPDFRef(shm.name, size),
+                    extract_kwargs,
+                    item_timeout,
+                )
+            except Exception:
+                shm.close()
+                shm.unlink()
+                raise
+        else:
+            future = executor.submit(
+                _extract_in_worker, pdf_source, extract_kwargs, item_timeout
+            )
+
+        if cache_key is not None:
+            future.add_done_callback(
+                lambda done: self._store_in_cache(cache_key, done)
+            )
+        self._watch_worker_timings(future)
+        return future, shm
+
+    def _extract_with_timeout(
+        self,
+        pdf_source,
+        extract_kwargs: Dict[str, Any],
+        item_timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Run extract_text_from_pdf on the thread pool, timed from when it starts."""
+        return self.extract_text_from_pdf(
+            pdf_source, **_with_deadline(extract_kwargs, item_timeout)
+        )
+
+    def _watch_worker_timings(self, future) -> None:
+        """
+        Report timings measured in a batch worker process to the hook.
+
+        Page timings are only available when the result is structured.
+        """
+        if self.instrumentation is None:
+            return
+
+        def record(done):
+            if done.cancelled() or done.exception() is not None:
+                return
+            result = done.result()
+            if not result.get("timings"):
+                return
+            try:
+                self.instrumentation.record(
+                    result["timings"],
+                    [page["timings"] for page in result.get("pages", ())],
+                )
             except Exception as e:
-                logger.error(f"Batch processing error: {str(e)}")
-                results.append({"text": "", "success": False, "error": str(e)})
+                logger.warning(f"PDF instrumentation hook failed: {str(e)}")
 
-        return results
+        future.add_done_callback(record)
+
+    def _store_in_cache(self, cache_key: str, future) -> None:
+        """Cache a successful result produced by a batch worker process."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        if result.get("success"):
+            self.cache.set(cache_key, result)
+
+    @staticmethod
+    def _release_shared_pdf(shm, *futures) -> None:
+        """Free a shared memory block once no worker task still needs it."""
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def release(_future=None):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            shm.close()
+            shm.unlink()
+
+        if not futures:
+            shm.close()
+            shm.unlink()
+            return
+        # A timed-out task may still be reading the block; callbacks of
+        # finished futures run right away
+        for future in futures:
+            future.add_done_callback(release)
+
+    def _get_process_executor(self) -> ProcessPoolExecutor:
+        """Create the batch process pool on first use."""
+        with self._pool_lock:
+            if self._process_executor is None:
+                context = multiprocessing.get_context("spawn")
+                self._ready_workers = context.Value("i", 0)
+                self._process_executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=_init_batch_worker,
+                    initargs=(
+                        self._worker_config(),
+                        self._page_cache_entries(),
+                        self._ready_workers,
+                    ),
+                )
+            return self._process_executor
+
+    def _batch_slots(self) -> int:
+        """Batch items that can be running right now (process workers start lazily)."""
+        if self.executor_backend == "thread":
+            return self.max_workers
+        if self._ready_workers is None:
+            return 0
+        return self._ready_workers.value
+
+    def _worker_config(self) -> Dict[str, Any]:
+        """Constructor arguments for analyzers running inside worker processes."""
+        return {
+            "ocr_enabled": self.ocr_enabled,
+            "ocr_language": self.ocr_language,
+            "ocr_dpi": self.ocr_dpi,
+            "ocr_max_pixels": self.ocr_max_pixels,
+            "ocr_grayscale": self.ocr_grayscale,
+            "ocr_binarize_threshold": self.ocr_binarize_threshold,
+            "ocr_backend": backend_for_workers(self.ocr_backend),
+            "probe_text_layer": self.probe_text_layer,
+            "min_image_coverage": self.min_image_coverage,
+            "max_download_bytes": self.max_download_bytes,
+            "spool_threshold_bytes": self.spool_threshold_bytes,
+            "download_retries": self.download_retries,
+            "retry_backoff": self.retry_backoff,
+            "max_workers": 1,
+            "timeout": self.timeout,
+            # Workers already run one document per process
+            "ocr_workers": None,
+        }
+
+    def close(self) -> None:
+        """Shut down worker pools, the OCR backend and the download session."""
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown(wait=False)
+        if getattr(self, "_ocr_pool", None) is not None:
+            self._ocr_pool.shutdown(wait=False)
+            self._ocr_pool = None
+        if getattr(self, "_process_executor", None) is not None:
+            self._process_executor.shutdown(wait=False)
+            self._process_executor = None
+            self._ready_workers = None
+        if getattr(self, "ocr_backend", None) is not None:
+            self.ocr_backend.close()
+        if getattr(self, "_session", None) is not None:
+            self._session.close()
+            self._session = None
 
     def __del__(self):
         """Cleanup executor on destruction."""
-        if hasattr(self, "_executor"):
-            self._executor.shutdown(wait=False)
+        self.close()
@@ -0,0 +1,160 @@
+"""Scrapy item pipeline that extracts PDF text off the reactor thread."""
+
+import logging
+import time
+
+from itemadapter import ItemAdapter
+from twisted.internet import defer
+
+from .instrumentation import PDFTimingStats
+from .pdf_analyzer import PDFAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+class PDFExtractionPipeline:
+    """
+    Extract text from PDFs carried by items, without blocking the reactor.
+
+    Items with PDF bytes in `bytes_field` (or a URL/path in `url_field`) are
+    sent to a PDFAnalyzer pool. At most `max_concurrent` extractions run at a
+    time; other items wait their turn, which keeps memory bounded. The result
+    is stored in `result_field` and the bytes are removed from the item.
+
+    Settings:
+        PDF_EXTRACTION_MAX_CONCURRENT: Parallel extractions (default 4)
+        PDF_EXTRACTION_BYTES_FIELD: Field with PDF bytes (default "pdf_bytes")
+        PDF_EXTRACTION_URL_FIELD: Field with a PDF URL or path (default "pdf_url")
+        PDF_EXTRACTION_RESULT_FIELD: Field for the result (default "pdf_extraction")
+        PDF_EXTRACTION_KEEP_BYTES: Keep the PDF bytes in the item (default False)
+        PDF_EXTRACTION_OCR_ENABLED: Enable OCR fallback (default True)
+        PDF_EXTRACTION_OCR_LANGUAGE: Tesseract languages (default "eng+spa")
+        PDF_EXTRACTION_EXECUTOR_BACKEND: "thread" or "process" (default "thread")
+        PDF_EXTRACTION_TIMEOUT: Download timeout in seconds (default 30)
+        PDF_EXTRACTION_ITEM_TIMEOUT: Seconds one extraction may take once it
+            starts, so a runaway document cannot hold its slot forever
+            (default: PDF_EXTRACTION_TIMEOUT; 0 or None disables it)
+        PDF_EXTRACTION_TIMINGS: Record phase timing histograms in the stats
+            under "pdf_analyzer/timing/" (default True)
+    """
+
+    def __init__(
+        self,
+        stats=None,
+        analyzer=None,
+        max_concurrent=4,
+        bytes_field="pdf_bytes",
+        url_field="pdf_url",
+        result_field="pdf_extraction",
+        keep_bytes=False,
+        item_timeout=None,
+    ):
+        self.stats = stats
+        self.max_concurrent = max(1, max_concurrent)
+        self.analyzer = analyzer or PDFAnalyzer(max_workers=self.max_concurrent)
+        self.bytes_field = bytes_field
+        self.url_field = url_field
+        self.result_field = result_field
+        self.keep_bytes = keep_bytes
+        self.item_timeout = item_timeout
+        self._semaphore = defer.DeferredSemaphore(self.max_concurrent)
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        max_concurrent = settings.getint("PDF_EXTRACTION_MAX_CONCURRENT", 4)
+        timeout = settings.getint("PDF_EXTRACTION_TIMEOUT", 30)
+        item_timeout = settings.get("PDF_EXTRACTION_ITEM_TIMEOUT", timeout)
+
+        analyzer = PDFAnalyzer(
+            ocr_enabled=settings.getbool("PDF_EXTRACTION_OCR_ENABLED", True),
+            ocr_language=settings.get("PDF_EXTRACTION_OCR_LANGUAGE", "eng+spa"),
+            max_workers=max_concurrent,
+            timeout=timeout,
+            executor_backend=settings.get("PDF_EXTRACTION_EXECUTOR_BACKEND", "thread"),
+            instrumentation=(
+                PDFTimingStats(crawler.stats)
+                if settings.getbool("PDF_EXTRACTION_TIMINGS", True)
+                else None
+            ),
+        )
+
+        return cls(
+            stats=crawler.stats,
+            analyzer=analyzer,
+            max_concurrent=max_concurrent,
+            bytes_field=settings.get("PDF_EXTRACTION_BYTES_FIELD", "pdf_bytes"),
+            url_field=settings.get("PDF_EXTRACTION_URL_FIELD", "pdf_url"),
+            result_field=settings.get("PDF_EXTRACTION_RESULT_FIELD", "pdf_extraction"),
+            keep_bytes=settings.getbool("PDF_EXTRACTION_KEEP_BYTES", False),
+            item_timeout=float(item_timeout) if item_timeout else None,
+        )
+
+    def close_spider(self, spider):
+        self.analyzer.close()
+
+    def process_item(self, item, spider):
+        adapter = ItemAdapter(item)
+        pdf_source = adapter.get(self.bytes_field) or adapter.get(self.url_field)
+        if not pdf_source:
+            return item
+
+        return self._semaphore.run(self._extract, item, adapter, pdf_source)
+
+    def _extract(self, item, adapter, pdf_source):
+        start = time.monotonic()
+        d = _deferred_from_future(
+            self.analyzer.submit_extraction(pdf_source, item_timeout=self.item_timeout)
+        )
+        d.addErrback(
+            lambda failure: {
+                "text": "",
+                "success": False,
+                "error": str(failure.value),
+            }
+        )
+        d.addCallback(self._store_result, item, adapter, start)
+        return d
+
+    def _store_result(self, result, item, adapter, start):
+        elapsed = time.monotonic() - start
+        result = dict(result, extraction_seconds=round(elapsed, 4))
+        adapter[self.result_field] = result
+        if not self.keep_bytes and self.bytes_field in adapter:
+            del adapter[self.bytes_field]
+
+        if not result.get("success"):
+            logger.warning(f"PDF extraction failed: {result.get('error')}")
+        self._record_stats(result, elapsed)
+        return item
+
+    def _record_stats(self, result, elapsed):
+        if self.stats is None:
+            return
+        self.stats.inc_value("pdf_extraction/items")
+        self.stats.inc_value(
+            "pdf_extraction/success" if result.get("success") else "pdf_extraction/errors"
+        )
+        if result.get("ocr_used"):
+            self.stats.inc_value("pdf_extraction/ocr_used")
+        self.stats.inc_value("pdf_extraction/pages", result.get("total_pages") or 0)
+        self.stats.inc_value("pdf_extraction/time_total_seconds", elapsed)
+        self.stats.max_value("pdf_extraction/time_max_seconds", elapsed)
+
+
+def _deferred_from_future(future):
+    """Fire a Deferred on the reactor thread when a concurrent future finishes."""
+    from twisted.internet import reactor
+
+    d = defer.Deferred()
+
+    def fire(done):
+        if done.cancelled():
+            d.errback(defer.CancelledError())
+        elif done.exception() is not None:
+            d.errback(done.exception())
+        else:
+            d.callback(done.result())
+
+    future.add_done_callback(lambda done: reactor.callFromThread(fire, done))
+    return d
@@ -1,6 +1,9 @@
 import json
+from difflib import SequenceMatcher
 
-from ps_helper.confidence import normalize_with_confidence, score_normalized_value
+from ps_helper.confidence import normalized_value as normalized_value_module
+
+from ps_helper.confidence import NormalizerIndex, normalize_with_confidence, score_normalized_value
 
 
 def test_exact_match_returns_high_confidence():
@@ -163,3 +166,109 @@ def test_normalize_with_confidence_flags_ambiguous_candidates():
     )
 
     assert "ambiguous_classification" in result["validation"]["flags"]
+
+
+def test_normalizer_index_matches_module_functions():
+    allowed = ["Kitchen Cookware Sets", "Canvas Tools & Accessories", "Serving Trays", "serving trays", None, ""]
+    index = NormalizerIndex(allowed)
+
+    assert len(index) == 3
+    assert "SERVING TRAYS®" in index
+    for value in ["Kitchen tools", "Serving Trays", "Trays for serving", None]:
+        assert index.normalize(value, field_name="category") == normalize_with_confidence(
+            value, allowed, field_name="category"
+        )
+        assert index.score(value, "Serving Trays", llm_confidence=0.8) == score_normalized_value(
+            value, "Serving Trays", allowed, llm_confidence=0.8
+        )
+
+    weighted = [{"value": "Kitchen tools", "weight": 0.7}, {"value": "cookware", "weight": 0.3}]
+    assert index.normalize(extracted_values=weighted, minimum_label="POSSIBLE") == normalize_with_confidence(
+        extracted_values=weighted, allowed_values=allowed, minimum_label="POSSIBLE"
+    )
+
+
+def test_exact_match_fast_path_skips_fuzzy_scan_for_seen_values(monkeypatch):
+    allowed = ["Serving Trays", "Serving Tray", "Plates"]
+    index = NormalizerIndex(allowed)
+    full = normalize_with_confidence("serving trays", allowed, field_name="category")
+    full_score = score_normalized_value("Serving Trays", "serving trays", allowed)
+
+    first = index.normalize("serving trays", field_name="category", full_audit=False)
+    index.score("Serving Trays", "serving trays", full_audit=False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("fuzzy scan should be skipped")
+
+    monkeypatch.setattr(normalized_value_module, "SequenceMatcher", fail)
+    fast = index.normalize("serving trays", field_name="category", full_audit=False)
+    fast_score = index.score("Serving Trays", "serving trays", full_audit=False)
+
+    # The near duplicate keeps the ambiguity flag on the fast path
+    assert full["validation"]["flags"] == ["ambiguous_classification"]
+    assert first == fast == full
+    assert fast_score == full_score
+
+
+def test_candidate_limit_scores_only_trigram_shortlist():
+    allowed = [f"Brand {number:04d} Outdoor" for number in range(500)] + ["Kitchen Cookware Sets", "Serving Trays"]
+    full_index = NormalizerIndex(allowed)
+    index = NormalizerIndex(allowed, candidate_limit=20)
+
+    result = index.normalize("kitchen cookware set", top_k=2)
+    expected = full_index.normalize("kitchen cookware set", top_k=2)
+
+    assert result["suggested_value"] == "Kitchen Cookware Sets"
+    assert result["audit"]["top_candidates"][0] == expected["audit"]["top_candidates"][0]
+    assert result["audit"]["allowed_values_count"] == 502
+    assert len(index._shortlist(["kitchen cookware set"])[0]) == 2
+    assert len(index._shortlist(["brand 0001 outdoor"])[0]) == 20
+    assert index.normalize("brand 0001 outdor")["suggested_value"] == "Brand 0001 Outdoor"
+    assert NormalizerIndex(allowed[:10], candidate_limit=20).normalize("Brand 0003") == normalize_with_confidence(
+        "Brand 0003", allowed[:10]
+    )
+
+
+def test_top_k_ranking_matches_full_sort_with_ties():
+    allowed = ["Tray A", "Tray B", "Serving Trays", "Tray C", "Serving Tray Set", "Plates", "Trays"]
+    keys = [normalized_value_module._normalize_key(value) for value in allowed]
+    expected = sorted(
+        ({"value": value, "score": round(SequenceMatcher(None, "tray", key).ratio(), 4)} for value, key in zip(allowed, keys)),
+        key=lambda item: item["score"],
+        reverse=True,
+    )
+
+    for top_k in range(0, len(allowed) + 2):
+        assert normalized_value_module._rank_candidates("Tray", allowed, top_k) == expected[:top_k]
+
+
+def test_top_k_ranking_skips_ratio_for_hopeless_candidates(monkeypatch):
+    ratio_calls = []
+    original_ratio = SequenceMatcher.ratio
+
+    def counting_ratio(matcher):
+        ratio_calls.append(matcher.b)
+        return original_ratio(matcher)
+
+    monkeypatch.setattr(SequenceMatcher, "ratio", counting_ratio)
+    allowed = ["Serving Trays", "Serving Tray"] + [f"Completely unrelated category number {n}" for n in range(50)]
+
+    ranking = normalized_value_module._rank_candidates("serving tray", allowed, 2)
+
+    assert [item["value"] for item in ranking] == ["Serving Tray", "Serving Trays"]
+    assert len(ratio_calls) < 10
+
+
+def test_normalize_key_is_memoized_and_reports_cache_stats():
+    normalized_value_module.clear_normalize_key_cache()
+
+    assert normalized_value_module._normalize_key(" Serving\u200b Trays™ ") == "serving trays"
+    assert normalized_value_module._normalize_key(" Serving\u200b Trays™ ") == "serving trays"
+    assert normalized_value_module._normalize_key(None) == ""
+
+    info = normalized_value_module.normalize_key_cache_info()
+    assert (info["hits"], info["misses"], info["currsize"]) == (1, 1, 1)
+    assert info["maxsize"] == normalized_value_module.NORMALIZE_KEY_CACHE_SIZE
+
+    normalized_value_module.clear_normalize_key_cache()
+    assert normalized_value_module.normalize_key_cache_info()["currsize"] == 0
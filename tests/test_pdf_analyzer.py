@@ -0,0 +1,787 @@
+import asyncio
+import io
+import os
+import subprocess
+import sys
+import threading
+import time
+import types
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import fitz
+import pytest
+from PIL import Image
+
+from ps_helper.pdf import ocr_backends
+from ps_helper.pdf import pdf_analyzer as pdf_module
+from ps_helper.pdf.cache import MemoryLRUCache, PageOCRCache
+from ps_helper.pdf.pdf_analyzer import PDFAnalyzer
+
+
+def build_pdf(pages):
+    """Build a PDF in memory. "text:<value>" adds a text page, "scan" an image page."""
+    doc = fitz.open()
+    for spec in pages:
+        page = doc.new_page()
+        if spec.startswith("text:"):
+            page.insert_text((72, 72), spec[len("text:"):])
+        else:
+            pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 40), False)
+            pix.clear_with(120)
+            page.insert_image(fitz.Rect(72, 72, 272, 272), pixmap=pix)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    calls = []
+
+    def fake_image_to_string(image, lang=None, config=None):
+        calls.append(image.size)
+        return f"scanned text {len(calls)}"
+
+    monkeypatch.setattr(ocr_backends, "tesserocr", None)
+    monkeypatch.setattr(ocr_backends.pytesseract, "image_to_string", fake_image_to_string)
+    return calls
+
+
+def test_native_text_and_ocr_fallback_keep_page_order(fake_ocr):
+    analyzer = PDFAnalyzer()
+    pdf_bytes = build_pdf(["text:First page", "scan", "text:Third page"])
+
+    result = analyzer.extract_text_from_pdf(pdf_bytes)
+
+    assert result["success"] is True
+    assert result["total_pages"] == 3
+    assert result["pages_with_text"] == 2
+    assert result["ocr_used"] is True
+    assert result["text"].index("--- Page 1 ---") < result["text"].index(
+        "--- Page 2 (OCR) ---"
+    ) < result["text"].index("--- Page 3 ---")
+
+
+def test_parallel_ocr_matches_sequential_output(fake_ocr):
+    pdf_bytes = build_pdf(["scan", "text:Native", "scan", "scan", "scan"])
+
+    sequential = PDFAnalyzer().extract_text_from_pdf(pdf_bytes)
+
+    fake_ocr.clear()
+    analyzer = PDFAnalyzer(ocr_workers=2)
+    # Threads stand in for worker processes so the patched OCR stays active
+    analyzer._ocr_pool = ThreadPoolExecutor(max_workers=2)
+    parallel = analyzer.extract_text_from_pdf(pdf_bytes)
+
+    assert len(fake_ocr) == 4
+    markers = [line for line in parallel["text"].splitlines() if line.startswith("---")]
+    assert markers == [
+        "--- Page 1 (OCR) ---",
+        "--- Page 2 ---",
+        "--- Page 3 (OCR) ---",
+        "--- Page 4 (OCR) ---",
+        "--- Page 5 (OCR) ---",
+    ]
+    assert parallel["ocr_used"] == sequential["ocr_used"]
+
+
+def test_structured_result_lists_page_records(fake_ocr):
+    pdf_bytes = build_pdf(["text:First page", "scan", "text:Third page"])
+
+    result = PDFAnalyzer().extract_text_from_pdf(pdf_bytes, structured=True)
+
+    assert [(r["page"], r["source"], r["text"]) for r in result["pages"]] == [
+        (1, "native", "First page"),
+        (2, "ocr", "scanned text 1"),
+        (3, "native", "Third page"),
+    ]
+    assert all(r["chars"] == len(r["text"]) for r in result["pages"])
+    assert all(r["seconds"] >= 0 for r in result["pages"])
+    assert result["text"] == (
+        "--- Page 1 ---\nFirst page\n\n"
+        "--- Page 2 (OCR) ---\nscanned text 1\n\n"
+        "--- Page 3 ---\nThird page"
+    )
+
+
+def test_text_layer_probe_routes_pages(fake_ocr, monkeypatch):
+    doc = fitz.open(stream=build_pdf(["text:Native", "scan"]), filetype="pdf")
+    doc.new_page()
+    pdf_bytes = doc.tobytes()
+    doc.close()
+    get_text_calls = []
+    original_get_text = fitz.Page.get_text
+
+    def counting_get_text(page, *args, **kwargs):
+        get_text_calls.append(page.number)
+        return original_get_text(page, *args, **kwargs)
+
+    monkeypatch.setattr(fitz.Page, "get_text", counting_get_text)
+
+    result = PDFAnalyzer().extract_text_from_pdf(pdf_bytes, structured=True)
+
+    assert result["page_classes"] == {"native": 1, "ocr": 1, "blank": 1}
+    assert [r["source"] for r in result["pages"]] == ["native", "ocr", "blank"]
+    assert get_text_calls == [0]
+    assert len(fake_ocr) == 1
+
+
+def test_probe_reads_form_fields_and_annotations(fake_ocr):
+    doc = fitz.open()
+    widget = fitz.Widget()
+    widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
+    widget.field_name = "name"
+    widget.field_value = "Filled form value"
+    widget.rect = fitz.Rect(72, 72, 300, 100)
+    doc.new_page().add_widget(widget)
+    doc.new_page().add_freetext_annot(fitz.Rect(72, 72, 300, 120), "Annotated text")
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    result = PDFAnalyzer().extract_text_from_pdf(pdf_bytes)
+
+    assert result["page_classes"] == {"native": 2, "ocr": 0, "blank": 0}
+    assert "Filled form value" in result["text"]
+    assert "Annotated text" in result["text"]
+    assert fake_ocr == []
+
+
+def test_disabled_probe_keeps_text_first_routing(fake_ocr):
+    doc = fitz.open(stream=build_pdf(["scan"]), filetype="pdf")
+    doc.new_page()
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    result = PDFAnalyzer(probe_text_layer=False).extract_text_from_pdf(pdf_bytes)
+
+    assert result["page_classes"] is None
+    assert len(fake_ocr) == 2
+
+
+def test_page_range_extracts_only_selected_pages(fake_ocr):
+    pdf_bytes = build_pdf(["text:One", "scan", "text:Three", "scan"])
+
+    result = PDFAnalyzer().extract_text_from_pdf(pdf_bytes, pages=[1, 3, 9])
+
+    assert result["total_pages"] == 4
+    assert result["pages_processed"] == 2
+    assert "--- Page 1 ---" in result["text"]
+    assert "--- Page 3 ---" in result["text"]
+    assert "Page 2" not in result["text"]
+    assert fake_ocr == []
+
+    from_generator = PDFAnalyzer().extract_text_from_pdf(pdf_bytes, pages=(n for n in [1, 3]))
+    assert from_generator["pages_processed"] == 2
+    assert from_generator["text"] == result["text"]
+
+
+def test_max_chars_stops_before_later_pages(fake_ocr):
+    pdf_bytes = build_pdf(["text:Header page", "scan", "scan", "scan"])
+
+    result = PDFAnalyzer().extract_text_from_pdf(pdf_bytes, max_chars=10)
+
+    assert result["text"] == "--- Page 1"
+    assert result["pages_processed"] == 1
+    assert result["stopped_early"] is True
+    assert fake_ocr == []
+
+
+def test_stop_when_predicate_ends_extraction(fake_ocr):
+    pdf_bytes = build_pdf(["text:Intro", "scan", "text:Keyword", "scan"])
+    seen = []
+
+    def found(page_text):
+        seen.append(page_text)
+        return "scanned" in page_text
+
+    result = PDFAnalyzer().extract_text_from_pdf(pdf_bytes, stop_when=found)
+
+    assert seen == ["Intro", "scanned text 1"]
+    assert result["pages_processed"] == 2
+    assert result["stopped_early"] is True
+    assert result["ocr_used"] is True
+    assert len(fake_ocr) == 1
+
+
+def test_local_path_is_opened_from_disk_without_copy(tmp_path):
+    path = tmp_path / "local.pdf"
+    path.write_bytes(build_pdf(["text:On disk"]))
+    analyzer = PDFAnalyzer(ocr_enabled=False)
+
+    loaded = analyzer._load_pdf(str(path))
+    result = analyzer.extract_text_from_pdf(str(path))
+    missing = analyzer.extract_text_from_pdf(str(tmp_path / "missing.pdf"))
+
+    assert loaded.data is None and loaded.source == str(path)
+    assert "On disk" in result["text"]
+    assert path.exists()
+    assert missing["success"] is False
+    assert "No such PDF file" in missing["error"]
+
+
+def test_invalid_source_returns_error_result():
+    result = PDFAnalyzer().extract_text_from_pdf(12345)
+
+    assert result["success"] is False
+    assert result["error"]
+
+
+def test_unknown_executor_backend_is_rejected():
+    with pytest.raises(ValueError):
+        PDFAnalyzer(executor_backend="gpu")
+
+
+def test_process_backend_returns_results_in_input_order(tmp_path):
+    first = build_pdf(["text:Alpha document"])
+    second_path = tmp_path / "second.pdf"
+    second_path.write_bytes(build_pdf(["text:Beta document", "text:More beta"]))
+    analyzer = PDFAnalyzer(ocr_enabled=False, max_workers=2, executor_backend="process")
+
+    results = analyzer.extract_text_batch([first, str(second_path), b""])
+
+    assert [result["success"] for result in results] == [True, True, False]
+    assert "Alpha document" in results[0]["text"]
+    assert results[1]["total_pages"] == 2
+    assert "Beta document" in results[1]["text"]
+
+
+def test_iter_text_batch_yields_indexed_results_with_bounded_window(monkeypatch):
+    analyzer = PDFAnalyzer(ocr_enabled=False, max_workers=2)
+    pulled = []
+
+    def sources():
+        for number in range(6):
+            pulled.append(number)
+            yield build_pdf([f"text:Document {number}"])
+
+    stream = analyzer.iter_text_batch(sources(), max_in_flight=2)
+    first_index, first_result = next(stream)
+
+    assert len(pulled) <= 3
+    results = dict([(first_index, first_result), *stream])
+    assert sorted(results) == list(range(6))
+    for index, result in results.items():
+        assert f"Document {index}" in result["text"]
+
+
+def test_extract_text_batch_keeps_order_for_generators():
+    analyzer = PDFAnalyzer(ocr_enabled=False, max_workers=2)
+    sources = (build_pdf([f"text:Document {number}"]) for number in range(5))
+
+    results = analyzer.extract_text_batch(sources, max_in_flight=2)
+
+    assert [f"Document {number}" in r["text"] for number, r in enumerate(results)] == [
+        True
+    ] * 5
+
+
+def test_pools_are_created_once_under_concurrent_use(monkeypatch):
+    created = []
+
+    class SlowPool:
+        def __init__(self, *args, **kwargs):
+            time.sleep(0.05)
+            created.append(self)
+
+        def shutdown(self, wait=True):
+            pass
+
+    monkeypatch.setattr(pdf_module, "ProcessPoolExecutor", SlowPool)
+    analyzer = PDFAnalyzer(max_workers=4, ocr_workers=2)
+
+    with ThreadPoolExecutor(max_workers=4) as threads:
+        ocr_pools = set(threads.map(lambda _: analyzer._get_ocr_pool(), range(4)))
+        batch_pools = set(threads.map(lambda _: analyzer._get_process_executor(), range(4)))
+
+    assert len(ocr_pools) == len(batch_pools) == 1
+    assert len(created) == 2
+
+
+def test_broken_ocr_pool_is_replaced(fake_ocr):
+    from concurrent.futures.process import BrokenProcessPool
+
+    class BrokenPool:
+        shut_down = False
+
+        def submit(self, *args, **kwargs):
+            future = Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+        def shutdown(self, wait=True):
+            self.shut_down = True
+
+    broken = BrokenPool()
+    analyzer = PDFAnalyzer(ocr_workers=2)
+    analyzer._ocr_pool = broken
+
+    result = analyzer.extract_text_from_pdf(build_pdf(["scan", "scan"]))
+
+    assert result["text"].count("scanned text") == 2
+    assert analyzer._ocr_pool is None
+    assert broken.shut_down
+
+
+def test_parallel_ocr_shares_pdf_bytes_instead_of_pickling_them(fake_ocr):
+    from multiprocessing import shared_memory
+
+    sent = []
+
+    class RecordingPool(ThreadPoolExecutor):
+        def submit(self, fn, pdf_source, *args, **kwargs):
+            sent.append(pdf_source)
+            return super().submit(fn, pdf_source, *args, **kwargs)
+
+    analyzer = PDFAnalyzer(ocr_workers=2)
+    analyzer._ocr_pool = RecordingPool(max_workers=2)
+
+    result = analyzer.extract_text_from_pdf(build_pdf(["scan", "scan", "scan"]))
+
+    assert result["text"].count("scanned text") == 3
+    assert len(sent) == 2 and sent[0] == sent[1]
+    assert isinstance(sent[0], pdf_module._SharedPDFRef)
+    # The block is unlinked by a done-callback, just after the last chunk returns
+    for _ in range(50):
+        try:
+            shared_memory.SharedMemory(name=sent[0].name).close()
+        except FileNotFoundError:
+            break
+        time.sleep(0.01)
+    else:
+        pytest.fail("shared memory block was not released")
+
+
+def test_expired_deadline_returns_timed_out_error():
+    result = PDFAnalyzer().extract_text_from_pdf(
+        build_pdf(["text:Late"]), deadline=time.time() - 1
+    )
+
+    assert result["success"] is False
+    assert result["timed_out"] is True
+
+
+def test_batch_item_timeout_cancels_slow_documents(fake_ocr, monkeypatch):
+    original_image_to_string = ocr_backends.pytesseract.image_to_string
+
+    def slow_ocr(image, lang=None, config=None):
+        time.sleep(0.2)
+        return original_image_to_string(image, lang=lang, config=config)
+
+    monkeypatch.setattr(ocr_backends.pytesseract, "image_to_string", slow_ocr)
+    analyzer = PDFAnalyzer(max_workers=1)
+    slow = build_pdf(["scan"] * 10)
+    fast = build_pdf(["text:Quick"])
+
+    start = time.monotonic()
+    results = analyzer.extract_text_batch([slow, slow, fast], item_timeout=0.5)
+    elapsed = time.monotonic() - start
+
+    assert [r["success"] for r in results] == [False, False, True]
+    assert results[0]["timed_out"] and results[1]["timed_out"]
+    assert elapsed < 2
+    # The running document stopped at a page boundary instead of finishing
+    time.sleep(0.5)
+    assert len(fake_ocr) < 10
+
+
+def test_batch_item_timeout_counts_from_start_not_from_queueing(fake_ocr, monkeypatch):
+    original_image_to_string = ocr_backends.pytesseract.image_to_string
+
+    def slow_ocr(image, lang=None, config=None):
+        time.sleep(0.15)
+        return original_image_to_string(image, lang=lang, config=config)
+
+    monkeypatch.setattr(ocr_backends.pytesseract, "image_to_string", slow_ocr)
+    analyzer = PDFAnalyzer(max_workers=1)
+    document = build_pdf(["scan", "scan"])
+
+    # Each item takes ~0.3s, well within its timeout, but waits ~0.9s in line
+    results = analyzer.extract_text_batch([document] * 4, item_timeout=0.6)
+
+    assert [r["success"] for r in results] == [True] * 4
+    assert not any(r.get("timed_out") for r in results)
+
+
+def test_batch_item_timeout_keeps_results_finished_while_consumer_was_busy(
+    fake_ocr, monkeypatch
+):
+    original_image_to_string = ocr_backends.pytesseract.image_to_string
+
+    def slow_ocr(image, lang=None, config=None):
+        time.sleep(0.3)
+        return original_image_to_string(image, lang=lang, config=config)
+
+    monkeypatch.setattr(ocr_backends.pytesseract, "image_to_string", slow_ocr)
+    analyzer = PDFAnalyzer(max_workers=2)
+    fast = build_pdf(["text:Quick"])
+    slow = build_pdf(["scan"])
+
+    results = {}
+    for index, result in analyzer.iter_text_batch([fast, slow], item_timeout=1.0):
+        results[index] = result
+        # The slow document finishes within its timeout while this consumer
+        # is busy; its result is still delivered
+        time.sleep(2)
+
+    assert results[0]["success"] is True
+    assert results[1]["success"] is True
+    assert not results[1].get("timed_out")
+
+
+def test_parallel_ocr_deadline_cancels_pending_chunks(fake_ocr, monkeypatch):
+    original_image_to_string = ocr_backends.pytesseract.image_to_string
+
+    def slow_ocr(image, lang=None, config=None):
+        time.sleep(0.2)
+        return original_image_to_string(image, lang=lang, config=config)
+
+    monkeypatch.setattr(ocr_backends.pytesseract, "image_to_string", slow_ocr)
+    analyzer = PDFAnalyzer(ocr_workers=2)
+    analyzer._ocr_pool = ThreadPoolExecutor(max_workers=1)
+    pdf_bytes = build_pdf(["scan"] * 6)
+
+    with pytest.raises(pdf_module.ExtractionTimeout):
+        analyzer._ocr_pages_parallel(pdf_bytes, list(range(6)), time.time() + 0.3)
+
+    analyzer._ocr_pool.shutdown(wait=True)
+    # The second chunk never started
+    assert len(fake_ocr) == 3
+
+
+def test_page_cache_skips_ocr_for_repeated_pages(fake_ocr):
+    page_cache = PageOCRCache(max_entries=8)
+    analyzer = PDFAnalyzer(page_cache=page_cache)
+
+    first = analyzer.extract_text_from_pdf(build_pdf(["scan", "scan"]))
+    second = analyzer.extract_text_from_pdf(build_pdf(["text:Cover", "scan"]))
+
+    assert len(fake_ocr) == 1
+    assert page_cache.ocr_calls_avoided == 2
+    assert "--- Page 2 (OCR) ---\nscanned text 1" in first["text"]
+    assert "--- Page 2 (OCR) ---\nscanned text 1" in second["text"]
+
+
+def test_pixmap_to_image_matches_png_round_trip():
+    with fitz.open(stream=build_pdf(["text:Pixels", "scan"]), filetype="pdf") as doc:
+        for page in doc:
+            for colorspace in (fitz.csRGB, fitz.csGRAY):
+                pix = page.get_pixmap(colorspace=colorspace)
+                direct = pdf_module._pixmap_to_image(pix)
+                decoded = Image.open(io.BytesIO(pix.tobytes("png")))
+
+                assert direct.mode == decoded.mode
+                assert direct.size == decoded.size
+                assert direct.tobytes() == decoded.tobytes()
+                direct.close()
+
+
+def test_render_policy_caps_pixels_and_uses_grayscale():
+    doc = fitz.open()
+    doc.new_page(width=595, height=842)  # A4
+    doc.new_page(width=2384, height=3370)  # A0 plan
+    options = PDFAnalyzer(
+        ocr_dpi=300, ocr_max_pixels=9_000_000, ocr_grayscale=True
+    )._ocr_options()
+
+    a4 = pdf_module._render_page(doc[0], options)
+    plan = pdf_module._render_page(doc[1], options)
+    default = pdf_module._render_page(doc[0], PDFAnalyzer()._ocr_options())
+
+    assert a4.n == 1
+    assert a4.width == pytest.approx(595 * 300 / 72, abs=2)
+    assert plan.width * plan.height <= 9_000_000 * 1.01
+    # Defaults keep the previous 2x RGB render
+    assert (default.n, default.width) == (3, pytest.approx(595 * 2, abs=2))
+    doc.close()
+
+
+def test_binarize_threshold_produces_black_and_white_pages(monkeypatch):
+    seen = []
+
+    def capture(image, lang=None, config=None):
+        seen.append({value for _, value in image.getcolors()})
+        return "text"
+
+    monkeypatch.setattr(ocr_backends.pytesseract, "image_to_string", capture)
+    analyzer = PDFAnalyzer(ocr_binarize_threshold=128, ocr_backend="pytesseract")
+
+    analyzer.extract_text_from_pdf(build_pdf(["scan"]))
+
+    assert seen and seen[0] <= {0, 255}
+
+
+def test_invalid_binarize_threshold_is_rejected():
+    with pytest.raises(ValueError):
+        PDFAnalyzer(ocr_binarize_threshold=300)
+
+
+class RecordingBackend:
+    name = "recording"
+
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    def image_to_string(self, image, lang, config):
+        self.calls.append((image.mode, lang, config))
+        return "from custom backend"
+
+    def close(self):
+        self.closed = True
+
+
+def test_custom_ocr_backend_receives_rendered_pages():
+    backend = RecordingBackend()
+    analyzer = PDFAnalyzer(ocr_language="spa", ocr_backend=backend)
+
+    result = analyzer.extract_text_from_pdf(build_pdf(["scan"]))
+
+    assert "from custom backend" in result["text"]
+    assert backend.calls == [("RGB", "spa", pdf_module.TESSERACT_CONFIG)]
+
+
+def test_custom_ocr_backend_is_used_by_worker_processes():
+    pdf_bytes = build_pdf(["scan", "scan"])
+
+    batch = PDFAnalyzer(ocr_backend=RecordingBackend(), executor_backend="process", max_workers=1)
+    pages = PDFAnalyzer(ocr_backend=RecordingBackend(), ocr_workers=2)
+
+    assert "from custom backend" in batch.extract_text_batch([pdf_bytes])[0]["text"]
+    assert pages.extract_text_from_pdf(pdf_bytes)["text"].count("from custom backend") == 2
+    batch.close()
+    pages.close()
+
+
+def test_unpicklable_custom_backend_is_rejected_for_worker_processes():
+    backend = RecordingBackend()
+    backend.lock = threading.Lock()
+
+    PDFAnalyzer(ocr_backend=backend)
+    with pytest.raises(ValueError, match="picklable"):
+        PDFAnalyzer(ocr_backend=backend, ocr_workers=2)
+    with pytest.raises(ValueError, match="picklable"):
+        PDFAnalyzer(ocr_backend=backend, executor_backend="process")
+
+
+def test_ocr_backend_resolution(monkeypatch):
+    monkeypatch.setattr(ocr_backends, "tesserocr", None)
+
+    assert isinstance(ocr_backends.get_ocr_backend("auto"), ocr_backends.PytesseractBackend)
+    with pytest.raises(ImportError):
+        ocr_backends.get_ocr_backend("tesserocr")
+    with pytest.raises(ValueError):
+        ocr_backends.get_ocr_backend("easyocr")
+
+
+def test_tesserocr_backend_reuses_loaded_api(monkeypatch):
+    created = []
+
+    class FakeAPI:
+        def __init__(self, lang, oem, psm):
+            created.append((lang, oem, psm))
+            self.ended = False
+
+        def SetImage(self, image):
+            self.image = image
+
+        def GetUTF8Text(self):
+            return "persistent"
+
+        def End(self):
+            self.ended = True
+
+    fake_module = types.SimpleNamespace(
+        PyTessBaseAPI=FakeAPI,
+        OEM=types.SimpleNamespace(DEFAULT=3),
+        PSM=types.SimpleNamespace(AUTO=3),
+    )
+    monkeypatch.setattr(ocr_backends, "tesserocr", fake_module)
+    backend = ocr_backends.get_ocr_backend("auto", pool_size=2)
+    analyzer = PDFAnalyzer(ocr_backend=backend)
+
+    result = analyzer.extract_text_from_pdf(build_pdf(["scan", "scan", "scan"]))
+
+    assert isinstance(backend, ocr_backends.TesserocrBackend)
+    assert result["text"].count("persistent") == 3
+    assert created == [("eng+spa", 3, 6)]
+
+
+class FakeDownload:
+    def __init__(self, content, headers=None, chunk_size=1024):
+        self.content = content
+        self.headers = headers or {}
+        self.chunk_size = chunk_size
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        for start in range(0, len(self.content), self.chunk_size):
+            yield self.content[start:start + self.chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+def test_large_downloads_are_spooled_to_disk_and_removed(monkeypatch):
+    pdf_bytes = build_pdf(["text:Remote document"] * 5)
+    monkeypatch.setattr(
+        pdf_module.requests.Session, "get", lambda *args, **kwargs: FakeDownload(pdf_bytes)
+    )
+    analyzer = PDFAnalyzer(spool_threshold_bytes=2048)
+    opened = []
+    original_open = pdf_module._open_pdf
+
+    def tracking_open(pdf_source):
+        opened.append(pdf_source)
+        return original_open(pdf_source)
+
+    monkeypatch.setattr(pdf_module, "_open_pdf", tracking_open)
+
+    result = analyzer.extract_text_from_pdf("https://example.com/remote.pdf")
+
+    assert result["success"] is True
+    assert result["total_pages"] == 5
+    assert isinstance(opened[0], str)
+    assert not os.path.exists(opened[0])
+
+
+def test_download_over_max_size_is_rejected(monkeypatch):
+    pdf_bytes = build_pdf(["text:Too big"])
+    monkeypatch.setattr(
+        pdf_module.requests.Session, "get", lambda *args, **kwargs: FakeDownload(pdf_bytes)
+    )
+
+    result = PDFAnalyzer(max_download_bytes=100).extract_text_from_pdf(
+        "https://example.com/big.pdf"
+    )
+
+    assert result["success"] is False
+    assert "max_download_bytes" in result["error"]
+
+
+def test_download_session_is_pooled_and_reused():
+    analyzer = PDFAnalyzer(max_workers=8, download_retries=2)
+
+    session = analyzer._get_session()
+    adapter = session.get_adapter("https://example.com/a.pdf")
+
+    assert analyzer._get_session() is session
+    assert adapter._pool_maxsize == 8
+    assert adapter.max_retries.total == 2
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+class SlowBackend:
+    name = "slow"
+
+    def image_to_string(self, image, lang, config):
+        time.sleep(0.3)
+        return "slow scan"
+
+    def close(self):
+        pass
+
+
+def test_async_extraction_runs_off_the_event_loop():
+    analyzer = PDFAnalyzer(max_workers=2, ocr_backend=SlowBackend())
+    documents = [build_pdf([f"text:Async {number}", "scan"]) for number in range(3)]
+
+    async def extract_all():
+        events = []
+
+        async def ticker():
+            for _ in range(3):
+                await asyncio.sleep(0.01)
+                events.append("tick")
+
+        async def extract(doc):
+            result = await analyzer.aextract_text_from_pdf(doc)
+            events.append("extracted")
+            return result
+
+        results = await asyncio.gather(ticker(), *(extract(doc) for doc in documents))
+        return events, results[1:]
+
+    events, results = asyncio.run(extract_all())
+
+    # The ticker kept running while the slow OCR was in progress
+    assert events == ["tick"] * 3 + ["extracted"] * 3
+    assert [f"Async {number}" in result["text"] for number, result in enumerate(results)] == [True] * 3
+    assert all("slow scan" in result["text"] for result in results)
+
+
+def test_async_extraction_accepts_extraction_options(monkeypatch):
+    import ps_helper
+
+    monkeypatch.setattr(ps_helper, "pdf_analyzer", PDFAnalyzer(ocr_enabled=False), raising=False)
+    pdf_bytes = build_pdf(["text:First", "text:Second", "text:Third"])
+
+    result = asyncio.run(
+        ps_helper.aextract_text_from_pdf(pdf_bytes, pages=[2], structured=True)
+    )
+
+    assert result["pages_processed"] == 1
+    assert [record["text"] for record in result["pages"]] == ["Second"]
+
+
+def test_async_extraction_with_process_backend():
+    analyzer = PDFAnalyzer(ocr_enabled=False, max_workers=1, executor_backend="process")
+
+    result = asyncio.run(
+        analyzer.aextract_text_from_pdf(build_pdf(["text:From a worker"]))
+    )
+
+    assert "From a worker" in result["text"]
+
+
+def test_package_import_does_not_load_pdf_dependencies():
+    code = (
+        "import sys, ps_helper; "
+        "print(any(m in sys.modules for m in ('fitz', 'PIL', 'pytesseract'))); "
+        "print(type(ps_helper.pdf_analyzer).__name__, 'fitz' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.splitlines()
+
+    # PyMuPDF may print a deprecation notice for `fitz` while importing
+    assert output[0] == "False"
+    assert output[-1] == "PDFAnalyzer True"
+
+
+def test_process_backend_caches_local_paths(tmp_path):
+    path = tmp_path / "cached.pdf"
+    path.write_bytes(build_pdf(["text:Cached on disk"]))
+    cache = MemoryLRUCache(max_entries=4)
+    analyzer = PDFAnalyzer(ocr_enabled=False, max_workers=1, executor_backend="process", cache=cache)
+
+    first = analyzer.extract_text_batch([str(path)])
+    # The result is stored by a done-callback, which may run just after it is returned
+    for _ in range(50):
+        if len(cache):
+            break
+        time.sleep(0.01)
+    second = analyzer.extract_text_batch([str(path)])
+
+    assert "Cached on disk" in first[0]["text"]
+    assert second == first
+    assert cache.stats == {"hits": 1, "misses": 1}
+    assert not pdf_module._is_cacheable_source("https://example.com/a.pdf")
+
+
+def test_worker_config_keeps_download_limits():
+    analyzer = PDFAnalyzer(
+        max_download_bytes=1024, spool_threshold_bytes=512, download_retries=7, retry_backoff=2.0
+    )
+
+    config = analyzer._worker_config()
+    worker = PDFAnalyzer(**config)
+
+    assert config["max_download_bytes"] == 1024
+    assert config["spool_threshold_bytes"] == 512
+    assert (worker.max_download_bytes, worker.spool_threshold_bytes) == (1024, 512)
+    assert (worker.download_retries, worker.retry_backoff) == (7, 2.0)
@@ -0,0 +1,112 @@
+import fitz
+
+from ps_helper.pdf.cache import (
+    DiskCache,
+    MemoryLRUCache,
+    TieredCache,
+    extraction_cache_key,
+)
+from ps_helper.pdf.pdf_analyzer import PDFAnalyzer
+
+
+class DummyStats:
+    def __init__(self):
+        self._values = {}
+
+    def set_value(self, key, value):
+        self._values[key] = value
+
+    def get_value(self, key, default=None):
+        return self._values.get(key, default)
+
+
+def make_pdf(text):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_cache_key_depends_on_content_and_settings():
+    settings = {"ocr_language": "eng"}
+
+    assert extraction_cache_key(b"abc", settings) == extraction_cache_key(
+        bytearray(b"abc"), settings
+    )
+    assert extraction_cache_key(b"abc", settings) != extraction_cache_key(
+        b"abd", settings
+    )
+    assert extraction_cache_key(b"abc", settings) != extraction_cache_key(
+        b"abc", {"ocr_language": "spa"}
+    )
+
+
+def test_cache_key_for_file_matches_its_bytes(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.7 content")
+
+    assert extraction_cache_key(str(path), {}) == extraction_cache_key(
+        b"%PDF-1.7 content", {}
+    )
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryLRUCache(max_entries=2)
+    cache.set("a", {"text": "a"})
+    cache.set("b", {"text": "b"})
+    cache.get("a")
+    cache.set("c", {"text": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"text": "a"}
+    assert cache.stats == {"hits": 2, "misses": 1}
+
+
+def test_disk_cache_evicts_by_size(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=120)
+    cache.set("first", {"text": "x" * 40})
+    cache.set("second", {"text": "y" * 40})
+    cache.set("third", {"text": "z" * 40})
+
+    assert cache.size_bytes <= 120
+    assert cache.get("first") is None
+    assert cache.get("third") == {"text": "z" * 40}
+
+    reopened = DiskCache(str(tmp_path), max_bytes=120)
+    assert reopened.get("third") == {"text": "z" * 40}
+
+
+def test_analyzer_reuses_cached_result_for_identical_bytes(tmp_path, monkeypatch):
+    cache = TieredCache(MemoryLRUCache(), DiskCache(str(tmp_path)))
+    analyzer = PDFAnalyzer(cache=cache)
+    pdf_bytes = make_pdf("Cached document")
+    calls = []
+    original = analyzer._extract_document
+
+    def counting_extract(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(analyzer, "_extract_document", counting_extract)
+
+    first = analyzer.extract_text_from_pdf(pdf_bytes)
+    second = analyzer.extract_text_from_pdf(bytes(pdf_bytes))
+
+    assert first == second
+    assert len(calls) == 1
+    stats = DummyStats()
+    cache.push_stats(stats)
+    assert stats.get_value("pdf_analyzer/cache/hits") == 1
+    assert stats.get_value("pdf_analyzer/cache/misses") == 1
+    assert stats.get_value("pdf_analyzer/cache/memory_hits") == 1
+
+
+def test_failed_extractions_are_not_cached():
+    cache = MemoryLRUCache()
+    analyzer = PDFAnalyzer(cache=cache)
+
+    result = analyzer.extract_text_from_pdf(b"not a pdf")
+
+    assert result["success"] is False
+    assert len(cache) == 0
@@ -0,0 +1,67 @@
+import fitz
+
+from ps_helper.pdf.instrumentation import PDFTimingStats, TimingHistogram, timing_summary
+from ps_helper.pdf.pdf_analyzer import PDFAnalyzer
+
+
+class DummyStats:
+    def __init__(self):
+        self._values = {}
+
+    def set_value(self, key, value):
+        self._values[key] = value
+
+    def get_stats(self):
+        return dict(self._values)
+
+
+def make_pdf(text):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_histogram_buckets_observations():
+    histogram = TimingHistogram(buckets=(0.1, 1))
+
+    for seconds in (0.05, 0.1, 0.5, 3):
+        histogram.observe(seconds)
+
+    assert histogram.snapshot() == {
+        "count": 4,
+        "total_seconds": 3.65,
+        "max_seconds": 3,
+        "le_0.1": 2,
+        "le_1": 1,
+        "le_inf": 1,
+    }
+
+
+def test_timing_stats_are_mirrored_into_scrapy_stats():
+    stats = DummyStats()
+    hook = PDFTimingStats(stats, buckets=(1,))
+
+    hook.record({"download": 0.5, "ocr": 2.0}, [{"ocr": 2.0}])
+
+    values = stats.get_stats()
+    assert values["pdf_analyzer/timing/document/ocr/count"] == 1
+    assert values["pdf_analyzer/timing/document/total/total_seconds"] == 2.5
+    assert values["pdf_analyzer/timing/page/ocr/le_inf"] == 1
+    assert timing_summary(values)["document/download"]["le_1"] == 1
+    assert timing_summary({}) is None
+
+
+def test_analyzer_reports_phase_timings_to_hook():
+    hook = PDFTimingStats()
+    analyzer = PDFAnalyzer(instrumentation=hook)
+
+    result = analyzer.extract_text_from_pdf(make_pdf("Hello"), structured=True)
+
+    assert set(result["timings"]) == {"download", "open", "native_text"}
+    assert set(result["pages"][0]["timings"]) == {"native_text"}
+    snapshot = hook.snapshot()
+    assert snapshot["document/open"]["count"] == 1
+    assert snapshot["page/native_text"]["count"] == 1
+    assert "page/ocr" not in snapshot
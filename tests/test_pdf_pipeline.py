@@ -0,0 +1,146 @@
+import time
+import types
+
+import fitz
+import pytest
+from twisted.internet import reactor
+
+from ps_helper.pdf.pdf_analyzer import PDFAnalyzer
+from ps_helper.pdf.pipelines import PDFExtractionPipeline
+
+
+class DummyStats:
+    def __init__(self):
+        self._values = {}
+
+    def inc_value(self, key, value=1):
+        self._values[key] = self._values.get(key, 0) + value
+
+    def max_value(self, key, value):
+        self._values[key] = max(self._values.get(key, value), value)
+
+    def get_value(self, key, default=0):
+        return self._values.get(key, default)
+
+
+def make_pdf(text):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def direct_reactor_calls(monkeypatch):
+    # Fire deferreds directly from the worker thread; no reactor runs in tests
+    monkeypatch.setattr(reactor, "callFromThread", lambda fn, *args: fn(*args))
+
+
+def wait_for(deferred, timeout=10):
+    results = []
+    deferred.addBoth(results.append)
+    deadline = time.monotonic() + timeout
+    while not results and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert results, "deferred did not fire"
+    return results[0]
+
+
+def test_pipeline_extracts_text_and_records_stats(direct_reactor_calls):
+    stats = DummyStats()
+    pipeline = PDFExtractionPipeline(
+        stats=stats, analyzer=PDFAnalyzer(ocr_enabled=False), max_concurrent=2
+    )
+    item = {"url": "https://example.com/a.pdf", "pdf_bytes": make_pdf("Pipeline text")}
+
+    processed = wait_for(pipeline.process_item(item, spider=None))
+
+    assert processed is item
+    assert "pdf_bytes" not in item
+    assert "Pipeline text" in item["pdf_extraction"]["text"]
+    assert item["pdf_extraction"]["extraction_seconds"] >= 0
+    assert stats.get_value("pdf_extraction/items") == 1
+    assert stats.get_value("pdf_extraction/success") == 1
+    assert stats.get_value("pdf_extraction/ocr_used") == 0
+    assert stats.get_value("pdf_extraction/time_max_seconds") >= 0
+
+
+def test_pipeline_records_failures(direct_reactor_calls):
+    stats = DummyStats()
+    pipeline = PDFExtractionPipeline(stats=stats, analyzer=PDFAnalyzer(ocr_enabled=False))
+    item = {"pdf_bytes": b"not a pdf"}
+
+    wait_for(pipeline.process_item(item, spider=None))
+
+    assert item["pdf_extraction"]["success"] is False
+    assert stats.get_value("pdf_extraction/errors") == 1
+
+
+def test_items_without_pdf_pass_through():
+    pipeline = PDFExtractionPipeline(analyzer=PDFAnalyzer(ocr_enabled=False))
+    item = {"url": "https://example.com"}
+
+    assert pipeline.process_item(item, spider=None) is item
+
+
+def test_concurrent_extractions_are_capped(direct_reactor_calls):
+    pipeline = PDFExtractionPipeline(
+        analyzer=PDFAnalyzer(ocr_enabled=False), max_concurrent=2
+    )
+    deferreds = [
+        pipeline.process_item({"pdf_bytes": make_pdf(f"Item {n}")}, spider=None)
+        for n in range(5)
+    ]
+
+    assert pipeline._semaphore.limit == 2
+    items = [wait_for(d) for d in deferreds]
+    assert [item["pdf_extraction"]["success"] for item in items] == [True] * 5
+
+
+class SlowOCRBackend:
+    name = "slow"
+
+    def image_to_string(self, image, lang, config):
+        time.sleep(0.2)
+        return "slow page"
+
+    def close(self):
+        pass
+
+
+def make_scan_pdf(pages):
+    doc = fitz.open()
+    for _ in range(pages):
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 40), False)
+        pix.clear_with(120)
+        doc.new_page().insert_image(fitz.Rect(72, 72, 272, 272), pixmap=pix)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_item_timeout_stops_runaway_documents(direct_reactor_calls):
+    pipeline = PDFExtractionPipeline(
+        analyzer=PDFAnalyzer(ocr_backend=SlowOCRBackend()), item_timeout=0.3
+    )
+    item = {"pdf_bytes": make_scan_pdf(20)}
+
+    start = time.monotonic()
+    wait_for(pipeline.process_item(item, spider=None))
+
+    assert item["pdf_extraction"]["timed_out"] is True
+    assert time.monotonic() - start < 2
+
+
+def test_item_timeout_setting_defaults_to_timeout():
+    from scrapy.settings import Settings
+
+    def crawler(values):
+        return types.SimpleNamespace(settings=Settings(values), stats=DummyStats())
+
+    default = PDFExtractionPipeline.from_crawler(crawler({"PDF_EXTRACTION_TIMEOUT": 45}))
+    custom = PDFExtractionPipeline.from_crawler(crawler({"PDF_EXTRACTION_ITEM_TIMEOUT": 120}))
+    disabled = PDFExtractionPipeline.from_crawler(crawler({"PDF_EXTRACTION_ITEM_TIMEOUT": 0}))
+
+    assert (default.item_timeout, custom.item_timeout, disabled.item_timeout) == (45, 120, None)